@@ -0,0 +1,25 @@
+"""Console entry point."""
+
+import os
+import sys
+
+
+def main() -> None:
+    """Run the CLI, answering a bare --version without importing Click."""
+    if sys.argv[1:] == ["--version"]:
+        from . import __version__
+
+        # Same text as click.version_option for a console script
+        sys.stdout.write(f"{os.path.basename(sys.argv[0])}, version {__version__}\n")
+        return
+
+    from .cli import cli
+
+    cli()
+
+
+if __name__ == "__main__":
+    # `python -m uv_script_manager` goes straight to Click, which reports the -m program name
+    from uv_script_manager.cli import cli
+
+    cli()
@@ -0,0 +1 @@
+"""CLI subcommands, imported on demand by the root command group."""
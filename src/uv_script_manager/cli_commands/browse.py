@@ -0,0 +1,225 @@
+"""`browse` command."""
+
+import re
+from pathlib import Path
+
+import click
+
+from ..cli import _is_install_candidate, console
+
+# Matches GitHub repository URLs and captures (owner, repo)
+GITHUB_URL_PATTERN = re.compile(r"^https?://github\.com/([^/]+)/([^/]+?)(?:\.git)?/?$")
+
+
+def _install_hint_sort_key(path: Path) -> tuple[int, int, str]:
+    """Rank candidate scripts for the browse install hint."""
+    lowered_parts = [part.lower() for part in path.parts]
+    parent_parts = lowered_parts[:-1]
+    file_name = path.name.lower()
+
+    score = 0
+
+    if len(lowered_parts) == 1:
+        score -= 20
+    else:
+        score += len(lowered_parts) * 2
+
+    if parent_parts and parent_parts[0] in {"scripts", "bin"}:
+        score -= 8
+
+    if any(
+        part in {"docs", "doc", "tests", "test", "examples", "example", "samples", "sample"}
+        for part in parent_parts
+    ):
+        score += 60
+
+    if file_name in {"main.py", "cli.py", "run.py", "app.py", "tool.py", "server.py", "manage.py"}:
+        score -= 30
+
+    if file_name == "__main__.py":
+        score -= 25
+
+    return (score, len(lowered_parts), path.as_posix())
+
+
+@click.command("browse")
+@click.argument("git-url")
+@click.option(
+    "--all", "show_all", is_flag=True, help="Show all .py files including __init__.py, setup.py, etc."
+)
+@click.pass_context
+def browse(ctx: click.Context, git_url: str, show_all: bool) -> None:
+    """
+    Browse available Python scripts in a Git repository.
+
+    For GitHub repositories, tries the GitHub API first for fast listing
+    without cloning. If the API is unavailable or fails, falls back to
+    cloning and listing files from a local cache.
+
+    For non-GitHub repositories, clones to local cache and lists files.
+
+    By default, excludes common non-script files like __init__.py, setup.py,
+    conftest.py, etc.
+
+    Examples:
+
+        \b
+        # Browse scripts in a repository
+        uv-script-manager browse https://github.com/user/repo
+
+        \b
+        # Browse a specific branch
+        uv-script-manager browse https://github.com/user/repo#develop
+
+        \b
+        # Show all .py files including __init__.py, setup.py
+        uv-script-manager browse https://github.com/user/repo --all
+    """
+    import shutil
+    import subprocess
+
+    from rich.tree import Tree
+
+    from ..git_manager import GitError, clone_or_update, parse_git_url
+    from ..utils import get_repo_name_from_url
+
+    def filter_py_files(file_paths: list[str]) -> list[Path]:
+        """Filter and convert file paths to Path objects."""
+        py_files: list[Path] = []
+        for file_path in file_paths:
+            path = Path(file_path)
+            if _is_install_candidate(path, show_all=show_all):
+                py_files.append(path)
+        return py_files
+
+    def display_results(py_files: list[Path], repo_name: str) -> None:
+        """Display the results as a tree."""
+        if not py_files:
+            if show_all:
+                console.print("\n[yellow]No Python files found.[/yellow]")
+            else:
+                console.print("\n[yellow]No candidate scripts found.[/yellow]")
+                console.print("[dim]Try --all to include __init__.py, setup.py, test files, etc.[/dim]")
+            return
+
+        # Group file names by directory, using plain strings for sorting
+        files_by_dir: dict[str, list[str]] = {}
+        for file_path in sorted(py_file.as_posix() for py_file in py_files):
+            directory, _, file_name = file_path.rpartition("/")
+            files_by_dir.setdefault(directory, []).append(file_name)
+
+        # Display as tree (root-level files have an empty directory key)
+        console.print()
+        tree = Tree(f"[bold]{repo_name}[/bold]")
+
+        # Compare by path segments so subdirectories follow their parent ("a", "a/x", "a-b"),
+        # as sorting Path objects did
+        for directory in sorted(files_by_dir, key=lambda d: d.split("/")):
+            dir_node = tree.add(f"[blue]{directory}[/blue]") if directory else tree
+
+            for file_name in files_by_dir[directory]:
+                dir_node.add(f"[cyan]{file_name}[/cyan]")
+
+        console.print(tree)
+        found_label = "Python file(s)" if show_all else "candidate script(s)"
+        console.print(f"\n[dim]{len(py_files)} {found_label} found[/dim]")
+
+        # Show install hint using an installable candidate.
+        installable_files = [path for path in py_files if _is_install_candidate(path, show_all=False)]
+        if installable_files:
+            example_script = min(installable_files, key=_install_hint_sort_key)
+            console.print(
+                f"\n[dim]Install with: uv-script-manager install {git_url} -s {example_script}[/dim]"
+            )
+        elif show_all:
+            console.print(
+                "\n[dim]No candidate scripts in this list. "
+                "Remove --all to focus on likely install targets.[/dim]"
+            )
+
+    def try_github_api(owner: str, repo: str, ref: str | None) -> list[str] | None:
+        """Try to list .py files using GitHub API.
+
+        Returns file paths on success. Returns None when `gh` is not installed
+        or the API request fails, so the caller can fall back to clone.
+        """
+        # Check if gh is available
+        if shutil.which("gh") is None:
+            return None
+
+        # Use ref or default to HEAD
+        tree_ref = ref or "HEAD"
+
+        try:
+            result = subprocess.run(
+                [
+                    "gh",
+                    "api",
+                    f"repos/{owner}/{repo}/git/trees/{tree_ref}?recursive=1",
+                    "--jq",
+                    '.tree[] | select(.type == "blob" and (.path | endswith(".py"))) | .path',
+                ],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            # Each line is a .py file path
+            return [line for line in result.stdout.strip().split("\n") if line]
+        except subprocess.CalledProcessError:
+            return None
+
+    parsed = parse_git_url(git_url)
+
+    console.print(f"Browsing [cyan]{parsed.base_url}[/cyan]", end="")
+    if parsed.ref_value:
+        console.print(f" @ [yellow]{parsed.ref_value}[/yellow]")
+    else:
+        console.print()
+
+    repo_name = parsed.base_url.split("/")[-1]
+
+    # Check if it's a GitHub URL (format: https://github.com/owner/repo)
+    github_match = GITHUB_URL_PATTERN.match(parsed.base_url)
+    if github_match:
+        owner, repo = github_match.groups()
+
+        console.print("[dim]Fetching file list from GitHub API...[/dim]")
+        files = try_github_api(owner, repo, parsed.ref_value)
+
+        if files is not None:
+            py_files = filter_py_files(files)
+            display_results(py_files, repo_name)
+            return
+
+        console.print("[dim]GitHub API unavailable, falling back to clone...[/dim]")
+
+    # Fallback: clone/update to cached directory in temp
+    import tempfile
+
+    browse_cache_dir = Path(tempfile.gettempdir()) / "uv-script-manager-browse"
+    browse_cache_dir.mkdir(exist_ok=True)
+
+    repo_dir_name = get_repo_name_from_url(parsed.base_url)
+    repo_path = browse_cache_dir / repo_dir_name
+
+    try:
+        if repo_path.exists():
+            console.print("[dim]Updating cached repository...[/dim]")
+        else:
+            console.print("[dim]Cloning repository...[/dim]")
+
+        clone_or_update(
+            parsed.base_url,
+            parsed.ref_value,
+            repo_path,
+            depth=1,
+            ref_type=parsed.ref_type,
+        )
+    except GitError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        ctx.exit(1)
+
+    # Find all .py files from cloned repo
+    file_paths = [str(f.relative_to(repo_path)) for f in repo_path.rglob("*.py")]
+    py_files = filter_py_files(file_paths)
+    display_results(py_files, repo_name)
@@ -0,0 +1,50 @@
+"""`completion` command."""
+
+import os
+
+import click
+
+from ..cli import console
+
+
+@click.command("completion")
+@click.argument("shell", type=click.Choice(["fish", "bash", "zsh"]))
+def completion(shell: str) -> None:
+    """
+    Generate shell completion script.
+
+    Outputs a completion script for the specified shell. Save this to the
+    appropriate location for your shell to enable tab completion.
+
+    Examples:
+
+        \b
+        # Fish shell
+        uv-script-manager completion fish > ~/.config/fish/completions/uv-script-manager.fish
+
+        \b
+        # Bash shell
+        uv-script-manager completion bash > ~/.local/share/bash-completion/completions/uv-script-manager
+
+        \b
+        # Zsh shell
+        uv-script-manager completion zsh > ~/.zfunc/_uv-script-manager
+        # Then add: fpath+=~/.zfunc && autoload -Uz compinit && compinit
+    """
+    import subprocess
+
+    # Use click's built-in completion generation
+    env_var = "_UV_SCRIPT_MANAGER_COMPLETE"
+    shell_map = {
+        "fish": "fish_source",
+        "bash": "bash_source",
+        "zsh": "zsh_source",
+    }
+
+    result = subprocess.run(
+        ["uv-script-manager"],
+        env={**dict(os.environ), env_var: shell_map[shell]},
+        capture_output=True,
+        text=True,
+    )
+    console.print(result.stdout, end="")
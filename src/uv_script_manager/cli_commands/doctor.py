@@ -0,0 +1,137 @@
+"""`doctor` command."""
+
+import os
+from pathlib import Path
+
+import click
+
+from ..cli import console, get_state_manager
+
+
+@click.command("doctor")
+@click.option("--repair", is_flag=True, help="Automatically repair state issues")
+@click.pass_context
+def doctor(ctx: click.Context, repair: bool) -> None:
+    """
+    Run diagnostics and show system health information.
+
+    Displays configuration paths, verifies system dependencies, and validates
+    state integrity. Optionally repairs issues found during validation.
+
+    Examples:
+
+        \b
+        # Run diagnostics
+        uv-script-manager doctor
+
+        \b
+        # Run diagnostics and repair issues
+        uv-script-manager doctor --repair
+    """
+    from rich.console import Group, RenderableType
+    from rich.table import Table
+
+    from ..display import get_script_status_key, render_script_status
+    from ..script_installer import ScriptInstallerError, verify_uv_available
+
+    config = ctx.obj.config
+    state_manager = get_state_manager(ctx)
+
+    # Each section is rendered with a single print as soon as it is complete
+
+    # Configuration paths section
+    section: list[RenderableType] = ["\n[bold]Configuration[/bold]"]
+    config_table = Table(show_header=False, box=None, padding=(0, 2))
+    config_table.add_column("Label", style="dim")
+    config_table.add_column("Path")
+    config_table.add_column("Status", justify="right")
+
+    from ..config import get_config_path
+
+    # Missing config is an error; missing storage paths are created on demand, so only warn
+    path_rows = (
+        ("Config file:", get_config_path(), "[red]✗[/red]"),
+        ("Repository storage:", config.repo_dir, "[yellow]![/yellow]"),
+        ("Install directory:", config.install_dir, "[yellow]![/yellow]"),
+        ("State database:", config.state_file, "[yellow]![/yellow]"),
+    )
+    for label, path, missing_marker in path_rows:
+        config_table.add_row(label, str(path), "[green]✓[/green]" if os.path.exists(path) else missing_marker)
+
+    section.append(config_table)
+    console.print(Group(*section))
+
+    # System dependencies section
+    section = ["\n[bold]System Dependencies[/bold]"]
+    deps_table = Table(show_header=False, box=None, padding=(0, 2))
+    deps_table.add_column("Label", style="dim")
+    deps_table.add_column("Status", justify="right")
+
+    try:
+        verify_uv_available()
+        deps_table.add_row("uv (Python package manager):", "[green]✓ Available[/green]")
+    except ScriptInstallerError:
+        deps_table.add_row("uv (Python package manager):", "[red]✗ Not found[/red]")
+
+    import shutil
+
+    git_available = shutil.which("git") is not None
+    deps_table.add_row(
+        "git (Version control):", "[green]✓ Available[/green]" if git_available else "[red]✗ Not found[/red]"
+    )
+
+    section.append(deps_table)
+    console.print(Group(*section))
+
+    # State validation section
+    section = ["\n[bold]State Validation[/bold]"]
+    # With --repair, validation and repair share a single scan of the scripts' paths
+    if repair:
+        issues, report = state_manager.validate_and_repair(auto_fix=True)
+    else:
+        issues = state_manager.validate_state()
+
+    if not issues:
+        section.append(f"{render_script_status('clean')}: No issues found - state is healthy")
+    else:
+        section.append(f"{render_script_status('needs-attention')} Found {len(issues)} issue(s):\n")
+        section.append("\n".join(f"  {issue}" for issue in issues))
+
+        if repair:
+            section.append("\n[cyan]Repairing state...[/cyan]")
+            section.append("\n[green]✓ Repair complete[/green]")
+            if report["broken_symlinks_removed"] > 0:
+                section.append(f"  Removed {report['broken_symlinks_removed']} broken symlink(s)")
+            if report["missing_scripts_removed"] > 0:
+                removed_count = report["missing_scripts_removed"]
+                section.append(f"  Removed {removed_count} missing script(s) from database")
+        else:
+            section.append("\n[dim]Run 'uv-script-manager doctor --repair' to fix these issues[/dim]")
+
+    console.print(Group(*section))
+
+    # Script status section
+    section = ["\n[bold]Script Status[/bold]"]
+    scripts = state_manager.list_scripts()
+    if not scripts:
+        section.append("[dim]No scripts installed.[/dim]")
+    else:
+        status_counts: dict[str, int] = {}
+        local_changes_cache: dict[tuple[Path, str], str] = {}
+        for script in scripts:
+            status_key = get_script_status_key(script, local_changes_cache)
+            status_counts[status_key] = status_counts.get(status_key, 0) + 1
+
+        status_table = Table(show_header=False, box=None, padding=(0, 2))
+        status_table.add_column("Status")
+        status_table.add_column("Count", justify="right")
+
+        for status_key in ("needs-attention", "pinned", "local", "clean", "managed", "unknown"):
+            count = status_counts.get(status_key, 0)
+            if count:
+                status_table.add_row(render_script_status(status_key), str(count))
+
+        section.append(status_table)
+
+    section.append("")
+    console.print(Group(*section))
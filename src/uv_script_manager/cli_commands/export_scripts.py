@@ -0,0 +1,90 @@
+"""`export` command."""
+
+import json
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import click
+
+from ..cli import console, get_state_manager
+from ..constants import JSON_OUTPUT_INDENT, SourceType
+
+if TYPE_CHECKING:
+    from ..state import ScriptInfo
+
+
+def _script_to_export_entry(script: "ScriptInfo") -> dict[str, str | list[str] | bool | None]:
+    """Build the export file entry for one installed script."""
+    script_data: dict[str, str | list[str] | bool | None] = {
+        "name": script.name,
+        "source_type": script.source_type.value,
+    }
+
+    if script.source_type is SourceType.GIT:
+        if script.ref:
+            script_data["ref"] = script.ref
+        if script.ref_type:
+            script_data["ref_type"] = script.ref_type
+        script_data["source"] = script.source_url
+    else:
+        script_data["source"] = str(script.source_path) if script.source_path else None
+        script_data["copy_parent_dir"] = script.copy_parent_dir
+
+    if script.dependencies:
+        script_data["dependencies"] = script.dependencies
+
+    # Check for alias
+    if (symlink_path := script.symlink_path) and symlink_path.name != script.name:
+        script_data["alias"] = symlink_path.name
+
+    return script_data
+
+
+@click.command("export")
+@click.option(
+    "-o",
+    "--output",
+    type=click.Path(path_type=Path),
+    help="Output file path (default: stdout)",
+)
+@click.pass_context
+def export_scripts(ctx: click.Context, output: Path | None) -> None:
+    """
+    Export installed scripts to a JSON file for backup or sharing.
+
+    Creates a JSON file containing all installed scripts with their
+    source URLs, refs, and installation options. This file can be
+    used with 'uv-script-manager import' to reinstall scripts on another machine.
+
+    Examples:
+
+        \b
+        # Export to stdout
+        uv-script-manager export
+
+        \b
+        # Export to a file
+        uv-script-manager export -o scripts.json
+    """
+    state_manager = get_state_manager(ctx)
+
+    scripts = state_manager.list_scripts()
+
+    if not scripts:
+        click.echo("No scripts installed.")
+        return
+
+    export_data: dict[str, int | list[dict[str, str | list[str] | bool | None]]] = {
+        "version": 1,
+        "scripts": [_script_to_export_entry(script) for script in scripts],
+    }
+
+    # Serialize straight into the destination instead of building the whole document as a string
+    if output:
+        with output.open("w", encoding="utf-8") as fp:
+            json.dump(export_data, fp, indent=JSON_OUTPUT_INDENT)
+        console.print(f"[green]✓[/green] Exported {len(scripts)} script(s) to {output}")
+    else:
+        json.dump(export_data, sys.stdout, indent=JSON_OUTPUT_INDENT)
+        sys.stdout.write("\n")
@@ -0,0 +1,141 @@
+"""`import` command."""
+
+import json
+from dataclasses import dataclass, field, fields, replace
+from pathlib import Path
+from typing import Any
+
+import click
+
+from ..cli import console, get_state_manager, require_uv
+from ..constants import SourceType
+from ..refs import build_ref_suffix
+from .install import _build_install_request
+
+
+@dataclass(slots=True)
+class ImportEntry:
+    """One script entry from an export file."""
+
+    name: str | None = None
+    source: str | None = None
+    source_type: str = SourceType.GIT.value
+    ref: str | None = None
+    ref_type: str | None = None
+    dependencies: list[str] | None = field(default_factory=list)
+    alias: str | None = None
+    copy_parent_dir: bool = False
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ImportEntry":
+        """Build an entry from an export-file dict, ignoring unknown keys."""
+        return cls(**{key: data[key] for key in data.keys() & _IMPORT_ENTRY_FIELDS})
+
+
+_IMPORT_ENTRY_FIELDS = frozenset(entry_field.name for entry_field in fields(ImportEntry))
+
+
+@click.command("import")
+@click.argument("file", type=click.Path(exists=True, path_type=Path))
+@click.option("--force", "-f", is_flag=True, help="Force overwrite existing scripts without confirmation")
+@click.option("--dry-run", is_flag=True, help="Show what would be installed without actually installing")
+@click.pass_context
+def import_scripts(ctx: click.Context, file: Path, force: bool, dry_run: bool) -> None:
+    """
+    Import and install scripts from an export file.
+
+    Reads a JSON file created by 'uv-script-manager export' and installs
+    all scripts defined in it. Useful for setting up a new machine
+    or sharing script configurations.
+
+    Examples:
+
+        \b
+        # Import scripts from a file
+        uv-script-manager import scripts.json
+
+        \b
+        # Preview what would be installed
+        uv-script-manager import scripts.json --dry-run
+
+        \b
+        # Force overwrite existing scripts
+        uv-script-manager import scripts.json --force
+    """
+    require_uv()
+    from ..commands import InstallHandler
+    from ..display import display_install_results
+
+    config = ctx.obj.config
+
+    try:
+        # json.loads detects the encoding from raw bytes (including a UTF-8 BOM)
+        data = json.loads(file.read_bytes())
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        # Decoding now happens inside json.loads, so bad encodings surface here too
+        console.print(f"[red]Error:[/red] Invalid JSON file: {e}")
+        raise click.exceptions.Exit(1) from e
+
+    if "scripts" not in data:
+        console.print("[red]Error:[/red] Invalid export file: missing 'scripts' key")
+        raise click.exceptions.Exit(1)
+
+    if not data["scripts"]:
+        click.echo("No scripts to import.")
+        return
+
+    entries = [ImportEntry.from_dict(script_data) for script_data in data["scripts"]]
+
+    if dry_run:
+        console.print("[bold]Dry run - the following scripts would be installed:[/bold]\n")
+        for entry in entries:
+            ref_str = build_ref_suffix(entry.ref, entry.ref_type) if entry.ref else ""
+            alias_str = f" (as {entry.alias})" if entry.alias else ""
+            # Plain output: entries come from the import file and must not be parsed as Rich markup
+            click.echo(f"  {entry.name or 'unknown'}{alias_str} from {entry.source or 'unknown'}{ref_str}")
+        return
+
+    click.echo(f"Importing {len(entries)} script(s)...\n")
+
+    handler = InstallHandler(config, console, get_state_manager(ctx))
+    results = []
+    git_source_type = SourceType.GIT.value
+    # Options shared by every imported script; per-entry fields are filled in with replace()
+    request_template = _build_install_request(
+        with_deps=None,
+        force=force,
+        no_symlink=False,
+        install_dir=None,
+        verbose=False,
+        exact=None,
+        copy_parent_dir=False,
+        add_source_package=None,
+        alias=None,
+        no_deps=False,
+    )
+
+    for entry in entries:
+        name = entry.name
+        source = entry.source
+
+        if not name or not source:
+            results.append((name or "unknown", False, "Missing name or source"))
+            continue
+
+        # Build source URL with ref for Git sources
+        if entry.source_type == git_source_type and entry.ref:
+            source = f"{source}{build_ref_suffix(entry.ref, entry.ref_type)}"
+
+        try:
+            request = replace(
+                request_template,
+                with_deps=",".join(entry.dependencies) if entry.dependencies else None,
+                copy_parent_dir=entry.copy_parent_dir,
+                alias=entry.alias,
+            )
+            result = handler.install(source=source, scripts=(name,), request=request)
+            results.extend(result)
+        except (ValueError, FileNotFoundError, NotADirectoryError) as e:
+            results.append((name, False, str(e)))
+
+    display_install_results(results, config.install_dir, console)
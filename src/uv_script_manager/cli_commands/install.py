@@ -0,0 +1,332 @@
+"""`install` command."""
+
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import click
+
+from ..cli import _is_install_candidate, console, get_state_manager, require_uv
+
+if TYPE_CHECKING:
+    from ..commands import InstallRequest
+
+
+def _discover_install_script_candidates(source: str, clone_depth: int) -> list[str]:
+    """Discover candidate script paths for interactive install mode."""
+    import tempfile
+
+    from ..git_manager import GitError, clone_or_update, parse_git_url
+    from ..utils import expand_path, is_git_url, is_local_directory
+
+    def _collect_from_root(root: Path) -> list[str]:
+        """Collect installable Python script paths from a source root."""
+        candidates: list[str] = []
+        for py_file in root.rglob("*.py"):
+            rel_path = py_file.relative_to(root)
+            if _is_install_candidate(rel_path):
+                candidates.append(rel_path.as_posix())
+        return sorted(candidates)
+
+    if is_local_directory(source):
+        return _collect_from_root(expand_path(source))
+
+    if is_git_url(source):
+        parsed = parse_git_url(source)
+        with tempfile.TemporaryDirectory(prefix="uv-script-manager-install-") as temp_dir:
+            repo_path = Path(temp_dir) / "repo"
+            try:
+                clone_or_update(
+                    parsed.base_url,
+                    parsed.ref_value,
+                    repo_path,
+                    depth=clone_depth,
+                    ref_type=parsed.ref_type,
+                )
+            except GitError as e:
+                raise ValueError(str(e)) from e
+            return _collect_from_root(repo_path)
+
+    return []
+
+
+def _parse_script_selection(selection: str, max_index: int) -> list[int]:
+    """Parse comma-separated numeric selections and ranges."""
+    indexes: list[int] = []
+    seen: set[int] = set()
+
+    for token in selection.split(","):
+        token = token.strip()
+        if not token:
+            continue
+
+        if "-" in token:
+            start_str, end_str = token.split("-", 1)
+            if not start_str.isdigit() or not end_str.isdigit():
+                raise ValueError(f"Invalid range: {token}")
+            start = int(start_str)
+            end = int(end_str)
+            if start > end:
+                raise ValueError(f"Invalid range: {token}")
+            values = range(start, end + 1)
+        else:
+            if not token.isdigit():
+                raise ValueError(f"Invalid selection: {token}")
+            values = [int(token)]
+
+        for value in values:
+            if value < 1 or value > max_index:
+                raise ValueError(f"Selection out of range: {value}")
+            if value not in seen:
+                seen.add(value)
+                indexes.append(value)
+
+    if not indexes:
+        raise ValueError("No selections provided")
+
+    return indexes
+
+
+def _is_interactive_terminal() -> bool:
+    """Return True when running in an interactive terminal."""
+    return sys.stdin.isatty() and sys.stdout.isatty()
+
+
+def _prompt_for_script_selection(candidates: list[str]) -> tuple[str, ...]:
+    """Prompt user to select one or more scripts from candidates."""
+    console.print("[bold]No --script provided. Select script(s) to install:[/bold]")
+    for index, script_path in enumerate(candidates, start=1):
+        console.print(f"  [cyan]{index:>2}[/cyan]. {script_path}")
+
+    while True:
+        selection = click.prompt("Select script number(s)", default="1", show_default=True)
+        try:
+            indexes = _parse_script_selection(selection, len(candidates))
+            return tuple(candidates[index - 1] for index in indexes)
+        except ValueError as e:
+            console.print(f"[red]Error:[/red] {e}. Enter values like [cyan]1[/cyan] or [cyan]1,3-5[/cyan].")
+
+
+def _build_install_request(
+    *,
+    with_deps: str | None,
+    force: bool,
+    no_symlink: bool,
+    install_dir: Path | None,
+    verbose: bool,
+    exact: bool | None,
+    copy_parent_dir: bool,
+    add_source_package: str | None,
+    alias: str | None,
+    no_deps: bool,
+) -> "InstallRequest":
+    """Build a normalized install request shared by install/import paths."""
+    from ..commands import InstallRequest
+
+    return InstallRequest(
+        with_deps=with_deps,
+        force=force,
+        no_symlink=no_symlink,
+        install_dir=install_dir,
+        verbose=verbose,
+        exact=exact,
+        copy_parent_dir=copy_parent_dir,
+        add_source_package=add_source_package,
+        alias=alias,
+        no_deps=no_deps,
+    )
+
+
+@click.command()
+@click.argument("git-url")
+@click.option(
+    "--script",
+    "-s",
+    multiple=True,
+    help="Script names to install (can be specified multiple times)",
+)
+@click.option(
+    "--with",
+    "-w",
+    "with_deps",
+    help="Dependencies: requirements.txt path or comma-separated libs",
+)
+@click.option("--force", "-f", is_flag=True, help="Force overwrite existing scripts without confirmation")
+@click.option("--no-symlink", is_flag=True, help="Skip creating symlinks in install directory")
+@click.option(
+    "--install-dir",
+    type=click.Path(path_type=Path),
+    help="Custom installation directory (overrides config)",
+)
+@click.option("-v", "--verbose", is_flag=True, help="Show dependency resolution details")
+@click.option(
+    "--exact/--no-exact",
+    default=None,
+    help="Use --exact flag in shebang for precise dependency management (default: from config)",
+)
+@click.option(
+    "--copy-parent-dir",
+    is_flag=True,
+    help="For local sources: copy entire parent directory instead of just the script",
+)
+@click.option(
+    "--add-source-package",
+    default=None,
+    help="Add source as a local package dependency (optional: specify package name)",
+)
+@click.option(
+    "--alias",
+    default=None,
+    help="Custom name for the installed script (can only be used with a single script)",
+)
+@click.option(
+    "--no-deps",
+    is_flag=True,
+    help="Skip all dependency resolution (ignore requirements.txt and --with)",
+)
+@click.pass_context
+def install(
+    ctx: click.Context,
+    git_url: str,
+    script: tuple[str, ...],
+    with_deps: str | None,
+    force: bool,
+    no_symlink: bool,
+    install_dir: Path | None,
+    verbose: bool,
+    exact: bool | None,
+    copy_parent_dir: bool,
+    add_source_package: str | None,
+    alias: str | None,
+    no_deps: bool,
+) -> None:
+    """
+    Install Python scripts from a Git repository or local directory.
+
+    Downloads the specified repository (or copies from local directory),
+    processes the requested scripts, adds dependencies, modifies shebangs
+    to use 'uv run --script', and creates symlinks in the install directory.
+
+    Examples:
+
+        \b
+        # Install from Git repository
+        uv-script-manager install https://github.com/user/repo --script myscript.py
+
+        \b
+        # Install from local directory
+        uv-script-manager install /path/to/scripts --script app.py
+
+        \b
+        # Install from local directory, copying entire parent directory
+        uv-script-manager install /path/to/pyhprof --script spring_heapdumper.py --copy-parent-dir
+
+        \b
+        # Install with local package as dependency
+        uv-script-manager install /path/to/pyhprof --script spring_heapdumper.py \\
+            --copy-parent-dir --add-source-package=pyhprof
+
+        \b
+        # Install from Git repo and add as package dependency
+        uv-script-manager install https://github.com/user/repo --script app.py \\
+            --add-source-package=mypackage
+
+        \b
+        # Install multiple scripts
+        uv-script-manager install https://github.com/user/repo --script script1.py --script script2.py
+
+        \b
+        # Install with dependencies from requirements.txt
+        uv-script-manager install https://github.com/user/repo --script app.py --with requirements.txt
+
+        \b
+        # Install from a specific branch or tag
+        uv-script-manager install https://github.com/user/repo#dev --script app.py
+        uv-script-manager install https://github.com/user/repo@v1.0.0 --script app.py
+
+        \b
+        # Install with custom alias
+        uv-script-manager install https://github.com/user/repo --script long_script_name.py --alias short
+
+        \b
+        # Install without any dependencies
+        uv-script-manager install https://github.com/user/repo --script app.py --no-deps
+    """
+    require_uv()
+    from ..commands import InstallHandler
+    from ..display import display_install_results
+
+    config = ctx.obj.config
+
+    selected_scripts = script
+
+    if not selected_scripts:
+        from ..utils import is_git_url, is_local_directory
+
+        if not (is_local_directory(git_url) or is_git_url(git_url)):
+            console.print(f"[red]Error:[/red] Invalid source: {git_url}")
+            console.print("Source must be either a Git URL or a local directory path.")
+            raise click.exceptions.Exit(1)
+
+        if not _is_interactive_terminal():
+            console.print("[red]Error:[/red] --script is required in non-interactive mode.")
+            console.print(
+                "Use [cyan]uv-script-manager install <source> --script <script.py>[/cyan], "
+                "or run [cyan]uv-script-manager browse <source>[/cyan] first."
+            )
+            raise click.exceptions.Exit(1)
+
+        try:
+            candidates = _discover_install_script_candidates(git_url, config.clone_depth)
+        except ValueError as e:
+            console.print(f"[red]Error:[/red] Failed to discover scripts: {e}")
+            raise click.exceptions.Exit(1) from e
+
+        if not candidates:
+            console.print("[red]Error:[/red] No installable Python scripts found in source.")
+            console.print(
+                "Try [cyan]uv-script-manager browse <source> --all[/cyan] to inspect all Python files."
+            )
+            raise click.exceptions.Exit(1)
+
+        selected_scripts = _prompt_for_script_selection(candidates)
+
+    # Validate --alias flag usage
+    if alias is not None and len(selected_scripts) != 1:
+        console.print("[red]Error:[/red] --alias can only be used when installing a single script")
+        raise click.exceptions.Exit(1)
+
+    handler = InstallHandler(config, console, get_state_manager(ctx))
+
+    try:
+        request = _build_install_request(
+            with_deps=None if no_deps else with_deps,
+            force=force,
+            no_symlink=no_symlink,
+            install_dir=install_dir,
+            verbose=verbose,
+            exact=exact,
+            copy_parent_dir=copy_parent_dir,
+            add_source_package=add_source_package,
+            alias=alias,
+            no_deps=no_deps,
+        )
+        results = handler.install(source=git_url, scripts=selected_scripts, request=request)
+
+        install_directory = install_dir if install_dir else config.install_dir
+        display_install_results(results, install_directory, console)
+
+        installed_scripts = [name for name, success, _ in results if success]
+        if results and not installed_scripts:
+            console.print("[red]Error:[/red] Installation failed for all requested scripts.")
+            raise click.exceptions.Exit(1)
+
+        if installed_scripts:
+            if len(installed_scripts) == 1:
+                console.print(
+                    f"[dim]Next: uv-script-manager show {installed_scripts[0]} | uv-script-manager list[/dim]"
+                )
+            else:
+                console.print("[dim]Next: uv-script-manager list --verbose[/dim]")
+    except (ValueError, FileNotFoundError, NotADirectoryError) as e:
+        raise click.exceptions.Exit(1) from e
@@ -0,0 +1,313 @@
+"""`list` command."""
+
+import json
+import textwrap
+from collections.abc import Iterable
+from itertools import groupby
+from operator import itemgetter
+from pathlib import Path
+
+import click
+
+from ..cli import console, get_state_manager
+from ..constants import JSON_OUTPUT_INDENT
+
+
+def _filter_and_sort_scripts(
+    scripts,
+    source_filter: str | None,
+    status_filter: str | None,
+    ref_filter: str | None,
+    sort_by: str,
+):
+    """Filter and sort scripts for list command output."""
+    from ..constants import SourceType
+    from ..display import get_script_status_key
+
+    local_changes_cache: dict[tuple[Path, str], str] = {}
+    filtered = scripts
+
+    if source_filter:
+        source_text = source_filter.lower()
+        filtered = [
+            script
+            for script in filtered
+            if source_text
+            in (
+                (script.source_url or "")
+                if script.source_type is SourceType.GIT
+                else str(script.source_path or "")
+            ).lower()
+        ]
+
+    if ref_filter:
+        ref_text = ref_filter.lower()
+        filtered = [
+            script
+            for script in filtered
+            if script.source_type is SourceType.GIT and ref_text in (script.ref or "").lower()
+        ]
+
+    if status_filter:
+        status_key = status_filter.lower()
+        if status_key == "git":
+            filtered = [script for script in filtered if script.source_type is SourceType.GIT]
+        else:
+            filtered = [
+                script
+                for script in filtered
+                if get_script_status_key(script, local_changes_cache) == status_key
+            ]
+
+    if sort_by == "updated":
+        filtered = sorted(filtered, key=lambda script: script.installed_at, reverse=True)
+    elif sort_by == "source":
+        filtered = sorted(
+            filtered,
+            key=lambda script: (
+                (script.source_url or "")
+                if script.source_type is SourceType.GIT
+                else str(script.source_path or "")
+            ).lower(),
+        )
+    elif sort_by == "status":
+        filtered = sorted(
+            filtered,
+            key=lambda script: (
+                get_script_status_key(script, local_changes_cache),
+                script.display_name.lower(),
+            ),
+        )
+    else:
+        filtered = sorted(filtered, key=lambda script: script.display_name.lower())
+
+    return filtered
+
+
+def _echo_scripts_json(records: Iterable[dict[str, object]]) -> None:
+    """
+    Write a `{"scripts": [...]}` document one record at a time.
+
+    The output is identical to `json.dumps({"scripts": list(records)}, indent=JSON_OUTPUT_INDENT)`,
+    but each record is written as soon as it is serialized.
+
+    Args:
+        records: JSON-serializable script records
+    """
+    pad = " " * JSON_OUTPUT_INDENT
+    separator = "{\n" + pad + '"scripts": [\n'
+    wrote_any = False
+    for record in records:
+        encoded = json.dumps(record, indent=JSON_OUTPUT_INDENT)
+        click.echo(separator + textwrap.indent(encoded, pad * 2), nl=False)
+        separator = ",\n"
+        wrote_any = True
+    if wrote_any:
+        click.echo("\n" + pad + "]\n}")
+    else:
+        click.echo("{\n" + pad + '"scripts": []\n}')
+
+
+def _script_to_json(
+    script, local_changes_cache: dict[tuple[Path, str], str] | None = None
+) -> dict[str, object]:
+    """Serialize script info for JSON responses."""
+    from ..constants import SourceType
+    from ..display import get_script_status_key
+
+    payload: dict[str, object] = {
+        "name": script.name,
+        "display_name": script.display_name,
+        "source_type": script.source_type.value,
+        "source": script.source_url
+        if script.source_type is SourceType.GIT
+        else str(script.source_path or ""),
+        "ref": script.ref,
+        "ref_type": script.ref_type,
+        "commit_hash": script.commit_hash,
+        "installed_at": script.installed_at.isoformat(),
+        "dependencies": script.dependencies,
+        "repo_path": str(script.repo_path),
+        "symlink_path": str(script.symlink_path) if script.symlink_path else None,
+        "source_path": str(script.source_path) if script.source_path else None,
+        "copy_parent_dir": script.copy_parent_dir,
+    }
+
+    status_cache = local_changes_cache if local_changes_cache is not None else {}
+    payload["status"] = get_script_status_key(script, status_cache)
+    return payload
+
+
+def _print_needs_attention_hint(scripts) -> None:
+    """Print a follow-up hint when one or more scripts need attention."""
+    from ..display import get_script_status_key
+
+    local_changes_cache: dict[tuple[Path, str], str] = {}
+    needs_attention = [
+        script.display_name
+        for script in scripts
+        if get_script_status_key(script, local_changes_cache) == "needs-attention"
+    ]
+
+    if not needs_attention:
+        return
+
+    console.print(
+        "[#ff8c00]Some scripts need attention.[/] "
+        f"[dim]Example: uv-script-manager show {needs_attention[0]}[/dim]"
+    )
+
+
+@click.command("list")
+@click.option(
+    "-v",
+    "--verbose",
+    is_flag=True,
+    help="Show detailed information (commit hash, local changes, dependencies)",
+)
+@click.option("--tree", is_flag=True, help="Display scripts grouped by source in a tree view")
+@click.option("--full", is_flag=True, help="Disable truncation for table columns")
+@click.option("--json", "json_output", is_flag=True, help="Output list as JSON")
+@click.option("--source", help="Filter by source URL/path substring")
+@click.option(
+    "--status",
+    type=click.Choice(
+        ["local", "git", "pinned", "needs-attention", "clean", "managed", "unknown"],
+        case_sensitive=False,
+    ),
+    help="Filter by script status",
+)
+@click.option("--ref", "ref_filter", help="Filter git refs by substring")
+@click.option(
+    "--sort",
+    "sort_by",
+    type=click.Choice(["name", "updated", "source", "status"], case_sensitive=False),
+    default="name",
+    show_default=True,
+    help="Sort scripts by a column",
+)
+@click.pass_context
+def list_scripts(
+    ctx: click.Context,
+    verbose: bool,
+    tree: bool,
+    full: bool,
+    json_output: bool,
+    source: str | None,
+    status: str | None,
+    ref_filter: str | None,
+    sort_by: str,
+) -> None:
+    """
+    List all installed scripts with their details.
+
+    Displays information about installed scripts including name, status,
+    source, ref, and installation date. Use --verbose for commit hash,
+    local change state, and dependencies.
+
+    Examples:
+
+        \b
+        # List all scripts in table format (default)
+        uv-script-manager list
+
+        \b
+        # List with verbose output showing commit hash, local changes, and dependencies
+        uv-script-manager list -v
+
+        \b
+        # Display scripts grouped by source in a tree view
+        uv-script-manager list --tree
+
+        \b
+        # Tree view with verbose details
+        uv-script-manager list --tree -v
+
+        \b
+        # Show full values without truncation
+        uv-script-manager list --verbose --full
+
+        \b
+        # Filter and sort scripts
+        uv-script-manager list --status pinned --sort updated
+    """
+    # Before anything is installed there is no state file; don't create one (and migrate it) to list nothing
+    if ctx.obj.config.state_file.exists():
+        scripts = get_state_manager(ctx).list_scripts()
+        scripts = _filter_and_sort_scripts(scripts, source, status, ref_filter, sort_by)
+    else:
+        scripts = []
+
+    if not scripts:
+        if source or status or ref_filter:
+            click.echo("No scripts matched the provided filters.")
+        else:
+            click.echo("No scripts installed.")
+        return
+
+    from ..display import (
+        display_scripts_table,
+        get_script_display_name,
+        get_script_source_display,
+        get_script_status_key,
+        render_script_status,
+    )
+
+    if json_output:
+        if tree:
+            console.print("[red]Error:[/red] --json cannot be combined with --tree")
+            raise click.exceptions.Exit(1)
+        local_changes_cache: dict[tuple[Path, str], str] = {}
+        _echo_scripts_json(_script_to_json(script, local_changes_cache) for script in scripts)
+        return
+
+    if tree:
+        from rich.tree import Tree
+
+        # One pass computes each script's (source, name, display name); sorting the tuples keeps
+        # every source group contiguous and name-ordered for groupby
+        keyed_scripts = sorted(
+            (
+                (
+                    get_script_source_display(script, shorten_git=False),
+                    script.name,
+                    get_script_display_name(script, show_alias_target=True),
+                    script,
+                )
+                for script in scripts
+            ),
+            key=itemgetter(0, 1),
+        )
+        local_changes_by_script: dict[tuple[Path, str], str] = {}
+
+        # Display tree
+        tree_view = Tree("[bold]Installed Scripts by Source[/bold]")
+
+        for _, group in groupby(keyed_scripts, key=itemgetter(0)):
+            rows = [(name, script) for _, _, name, script in group]
+            source_node = tree_view.add(f"[magenta]{get_script_source_display(rows[0][1])}[/magenta]")
+
+            for name, script in rows:
+                if verbose:
+                    # Show detailed info in verbose mode
+                    details = []
+                    status_key = get_script_status_key(script, local_changes_by_script)
+                    status_detail = script.ref if status_key == "pinned" else None
+                    details.append(f"status: {render_script_status(status_key, status_detail)}")
+                    if script.commit_hash:
+                        details.append(f"commit: {script.commit_hash}")
+                    if script.dependencies:
+                        details.append(f"{len(script.dependencies)} deps")
+                    details.append(f"installed: {script.installed_at.strftime('%Y-%m-%d')}")
+
+                    details_str = f" ({', '.join(details)})" if details else ""
+                    source_node.add(f"[cyan]{name}[/cyan]{details_str}")
+                else:
+                    # Simple view - just show the name
+                    source_node.add(f"[cyan]{name}[/cyan]")
+
+        console.print(tree_view)
+    else:
+        display_scripts_table(scripts, verbose, console, full)
+
+    _print_needs_attention_hint(scripts)
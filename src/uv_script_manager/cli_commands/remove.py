@@ -0,0 +1,100 @@
+"""`remove` command."""
+
+from typing import TYPE_CHECKING
+
+import click
+
+from ..cli import complete_script_names, console, get_state_manager
+
+if TYPE_CHECKING:
+    from ..state import ScriptInfo, StateManager
+
+
+def _print_remove_clean_repo_impact_summary(state_manager: "StateManager", script_info: "ScriptInfo") -> None:
+    """Print compact impact summary for remove --clean-repo."""
+    scripts_from_repo = state_manager.get_scripts_from_repo(script_info.repo_path)
+    remaining = max(len(scripts_from_repo) - 1, 0)
+    repo_action = "will be removed" if remaining == 0 else f"kept (shared by {remaining} other script(s))"
+
+    console.print("[bold]Impact:[/bold] remove --clean-repo")
+    console.print(f"  Script: {script_info.display_name}")
+    console.print(f"  Repository: {script_info.repo_path} ({repo_action})")
+
+
+@click.command()
+@click.argument("script-name", shell_complete=complete_script_names)
+@click.option("--clean-repo", "-c", is_flag=True, help="Remove repository if no other scripts use it")
+@click.option("--force", "-f", is_flag=True, help="Skip confirmation prompt")
+@click.option("--dry-run", is_flag=True, help="Preview removal without making changes")
+@click.pass_context
+def remove(
+    ctx: click.Context,
+    script_name: str,
+    clean_repo: bool,
+    force: bool,
+    dry_run: bool,
+) -> None:
+    """
+    Remove an installed script and optionally clean up its repository.
+
+    Removes the script's symlink from the bin directory and updates the
+    installation state. If --clean-repo is specified and no other scripts
+    from the same repository are installed, removes the repository as well.
+
+    Examples:
+
+        \b
+        # Remove a script (keeps repository for other scripts)
+        uv-script-manager remove myscript
+
+        \b
+        # Remove script and clean up repository if unused
+        uv-script-manager remove myscript --clean-repo
+
+        \b
+        # Skip confirmation prompt
+        uv-script-manager remove myscript --force
+
+        \b
+        # Preview removal without applying changes
+        uv-script-manager remove myscript --dry-run
+    """
+    config = ctx.obj.config
+    state_manager = get_state_manager(ctx)
+
+    script_info = state_manager.get_script_flexible(script_name)
+    if clean_repo and script_info is not None:
+        _print_remove_clean_repo_impact_summary(state_manager, script_info)
+
+    if dry_run:
+        if script_info is None:
+            console.print(f"[red]Error:[/red] Script '{script_name}' not found.")
+            raise click.exceptions.Exit(1)
+        assert script_info is not None
+
+        console.print("[bold]Dry run:[/bold] remove")
+        console.print(f"  Script: {script_info.display_name}")
+        console.print(f"  Source: {script_info.source_display}")
+        symlink_display = str(script_info.symlink_path) if script_info.symlink_path else "Not symlinked"
+        console.print(f"  Symlink: {symlink_display}")
+
+        if clean_repo:
+            scripts_from_repo = state_manager.get_scripts_from_repo(script_info.repo_path)
+            if len(scripts_from_repo) == 1:
+                console.print(f"  Repository action: would remove {script_info.repo_path}")
+            else:
+                console.print("  Repository action: kept (shared by other scripts)")
+
+        console.print("[dim]Re-run without --dry-run to apply removal.[/dim]")
+        return
+
+    from ..commands import RemoveHandler
+    from ..script_installer import ScriptInstallerError
+
+    handler = RemoveHandler(config, console, state_manager)
+
+    try:
+        handler.remove(script_name, clean_repo, force)
+        console.print("[dim]Next: uv-script-manager list[/dim]")
+    except (ValueError, ScriptInstallerError) as e:
+        raise click.exceptions.Exit(1) from e
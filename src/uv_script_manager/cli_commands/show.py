@@ -0,0 +1,46 @@
+"""`show` command."""
+
+import json
+
+import click
+
+from ..cli import complete_script_names, console, get_state_manager
+from ..constants import JSON_OUTPUT_INDENT
+from .list_scripts import _script_to_json
+
+
+@click.command()
+@click.argument("script-name", shell_complete=complete_script_names)
+@click.option("--json", "json_output", is_flag=True, help="Output details as JSON")
+@click.pass_context
+def show(ctx: click.Context, script_name: str, json_output: bool) -> None:
+    """
+    Show detailed information about an installed script.
+
+    Displays comprehensive information about a specific script including
+    source details, paths, installation date, and dependencies.
+
+    Examples:
+
+        \b
+        # Show details for a script
+        uv-script-manager show myscript
+
+        \b
+        # Show details using alias
+        uv-script-manager show myalias
+    """
+    state_manager = get_state_manager(ctx)
+
+    script_info = state_manager.get_script_flexible(script_name)
+    if script_info is None:
+        console.print(f"[red]Error:[/red] Script '{script_name}' not found.")
+        raise click.exceptions.Exit(1)
+
+    if json_output:
+        click.echo(json.dumps({"script": _script_to_json(script_info)}, indent=JSON_OUTPUT_INDENT))
+        return
+
+    from ..display import display_script_details
+
+    display_script_details(script_info, console)
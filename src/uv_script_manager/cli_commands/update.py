@@ -0,0 +1,201 @@
+"""`update` and `update-all` commands."""
+
+import json
+from typing import TYPE_CHECKING, cast
+
+import click
+
+from ..cli import complete_script_names, console, get_state_manager, require_uv
+from ..constants import JSON_OUTPUT_INDENT
+
+if TYPE_CHECKING:
+    from ..state import StateManager
+
+
+def _update_results_to_json(results: list[tuple[str, str] | tuple[str, str, str]]) -> list[dict[str, object]]:
+    """Serialize update results for JSON responses."""
+    payload: list[dict[str, object]] = []
+    for result in results:
+        if len(result) == 3:
+            script_name, status, local_changes = cast(tuple[str, str, str], result)
+        else:
+            script_name, status = cast(tuple[str, str], result)
+            local_changes = None
+        payload.append(
+            {
+                "script": script_name,
+                "status": status,
+                "local_changes": local_changes,
+            }
+        )
+    return payload
+
+
+def _print_update_all_impact_summary(state_manager: "StateManager", dry_run: bool) -> None:
+    """Print compact impact summary for update --all."""
+    scripts = state_manager.list_scripts()
+    if not scripts:
+        return
+
+    local_count = sum(1 for script in scripts if script.source_type.value == "local")
+    git_count = len(scripts) - local_count
+    pinned_count = sum(1 for script in scripts if script.ref_type in ("tag", "commit"))
+
+    console.print("[bold]Impact:[/bold] update --all")
+    console.print(f"  Scripts: {len(scripts)} ({git_count} git, {local_count} local-only)")
+    if pinned_count:
+        console.print(
+            "  Pinned refs: "
+            f"{pinned_count} (stay pinned unless [cyan]--force[/cyan] or [cyan]--refresh-deps[/cyan])"
+        )
+    if dry_run:
+        console.print("  Mode: dry-run")
+
+
+@click.command()
+@click.argument("script-name", required=False, shell_complete=complete_script_names)
+@click.option("--all", "all_scripts", is_flag=True, help="Update all installed scripts")
+@click.option("--force", "-f", is_flag=True, help="Force reinstall even if up-to-date")
+@click.option(
+    "--exact/--no-exact",
+    default=None,
+    help="Use --exact flag in shebang for precise dependency management (default: from config)",
+)
+@click.option(
+    "--refresh-deps",
+    is_flag=True,
+    help="Re-resolve dependencies from repository (reads requirements.txt again)",
+)
+@click.option("--dry-run", is_flag=True, help="Show what would be updated without applying changes")
+@click.option("--json", "json_output", is_flag=True, help="Output update results as JSON")
+@click.pass_context
+def update(
+    ctx: click.Context,
+    script_name: str | None,
+    all_scripts: bool,
+    force: bool,
+    exact: bool | None,
+    refresh_deps: bool,
+    dry_run: bool,
+    json_output: bool,
+) -> None:
+    """
+    Update installed script(s) from their configured source.
+
+    For Git-backed scripts, fetches the latest changes and reinstalls when
+    needed (or when --force is specified). For local scripts, re-copies from
+    the original source path and reinstalls.
+
+    Examples:
+
+        \b
+        # Update a script if newer version available
+        uv-script-manager update myscript
+
+        \b
+        # Update all installed scripts
+        uv-script-manager update --all
+
+        \b
+        # Force reinstall even if already up-to-date
+        uv-script-manager update myscript --force
+
+        \b
+        # Update and re-resolve dependencies from requirements.txt
+        uv-script-manager update myscript --refresh-deps
+
+        \b
+        # Preview bulk updates without changing anything
+        uv-script-manager update --all --dry-run
+    """
+    if all_scripts and script_name:
+        console.print("[red]Error:[/red] Cannot use SCRIPT_NAME and --all together.")
+        console.print(
+            "Use [cyan]uv-script-manager update <script-name>[/cyan] "
+            "or [cyan]uv-script-manager update --all[/cyan]."
+        )
+        raise click.exceptions.Exit(1)
+
+    if not all_scripts and not script_name:
+        console.print("[red]Error:[/red] Missing SCRIPT_NAME or --all.")
+        console.print(
+            "Use [cyan]uv-script-manager update <script-name>[/cyan] "
+            "or [cyan]uv-script-manager update --all[/cyan]."
+        )
+        raise click.exceptions.Exit(1)
+
+    require_uv()
+    from ..commands import UpdateHandler
+    from ..display import display_update_results
+    from ..script_installer import ScriptInstallerError
+
+    config = ctx.obj.config
+    state_manager = get_state_manager(ctx)
+
+    if all_scripts and not json_output:
+        _print_update_all_impact_summary(state_manager, dry_run)
+
+    handler = UpdateHandler(config, console, state_manager)
+
+    try:
+        if all_scripts:
+            results = handler.update_all(force, exact, refresh_deps, dry_run, show_summary=not json_output)
+        else:
+            assert script_name is not None
+            results = [handler.update(script_name, force, exact, refresh_deps, dry_run)]
+
+        if results:
+            if json_output:
+                payload = {
+                    "results": _update_results_to_json(results),
+                    "all": all_scripts,
+                    "dry_run": dry_run,
+                }
+                click.echo(json.dumps(payload, indent=JSON_OUTPUT_INDENT))
+                return
+            else:
+                display_update_results(results, console)
+            if dry_run:
+                console.print("[dim]Re-run without --dry-run to apply updates.[/dim]")
+            elif all_scripts:
+                console.print("[dim]Next: uv-script-manager list --verbose[/dim]")
+            else:
+                assert script_name is not None
+                console.print(f"[dim]Next: uv-script-manager show {script_name}[/dim]")
+    except (ValueError, FileNotFoundError, ScriptInstallerError) as e:
+        raise click.exceptions.Exit(1) from e
+
+
+# TODO(next-major): Remove hidden `update-all` compatibility alias.
+@click.command("update-all", hidden=True)
+@click.option("--force", "-f", is_flag=True, help="Force reinstall all scripts")
+@click.option(
+    "--exact/--no-exact",
+    default=None,
+    help="Use --exact flag in shebang for precise dependency management (default: from config)",
+)
+@click.option(
+    "--refresh-deps",
+    is_flag=True,
+    help="Re-resolve dependencies from repository (reads requirements.txt again)",
+)
+@click.option("--dry-run", is_flag=True, help="Show what would be updated without applying changes")
+@click.pass_context
+def update_all(
+    ctx: click.Context,
+    force: bool,
+    exact: bool | None,
+    refresh_deps: bool,
+    dry_run: bool,
+) -> None:
+    """Compatibility alias for `update --all`."""
+    ctx.invoke(
+        update,
+        script_name=None,
+        all_scripts=True,
+        force=force,
+        exact=exact,
+        refresh_deps=refresh_deps,
+        dry_run=dry_run,
+        json_output=False,
+    )
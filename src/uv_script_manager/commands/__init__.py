@@ -1,7 +1,29 @@
 """Command handlers for the CLI."""
 
-from .install import InstallHandler, InstallRequest
-from .remove import RemoveHandler
-from .update import UpdateHandler
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .install import InstallHandler, InstallRequest
+    from .remove import RemoveHandler
+    from .update import UpdateHandler
+
+# Exported name -> submodule, imported on first access so one handler doesn't load the others
+_LAZY_EXPORTS = {
+    "InstallHandler": ".install",
+    "InstallRequest": ".install",
+    "RemoveHandler": ".remove",
+    "UpdateHandler": ".update",
+}
 
 __all__ = ["InstallHandler", "InstallRequest", "RemoveHandler", "UpdateHandler"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import handler classes on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -1,14 +1,19 @@
 """Install command handler."""
 
-from dataclasses import dataclass
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 from pathvalidate import ValidationError, validate_filepath
 from rich.console import Console
 
 from ..config import Config
-from ..constants import SourceType
+from ..constants import INSTALL_MAX_WORKERS, SourceType
 from ..deps import resolve_dependencies
 from ..git_manager import (
     GitRef,
@@ -40,7 +45,37 @@ from ..utils import (
 )
 
 
-@dataclass
+@lru_cache(maxsize=1024)
+def _validate_script_name(script_name: str) -> str | None:
+    """
+    Check a requested script name for invalid characters and path traversal.
+
+    Cached because `import` and repeated installs check the same names again.
+
+    Args:
+        script_name: Script path relative to the source root
+
+    Returns:
+        Error description, or None if the name is safe
+    """
+    try:
+        validate_filepath(script_name, platform="auto")
+    except ValidationError as e:
+        return str(e)
+
+    # Same segments Path(...).parts yields for a relative path: empty and "." segments dropped.
+    # Absolute forms start with a separator; any segment with a drive prefix ("C:x.py") would
+    # resolve against that drive on Windows, so those are rejected as well.
+    normalized_parts = [part for part in script_name.replace("\\", "/").split("/") if part not in ("", ".")]
+    is_absolute_like = script_name.startswith(("/", "\\")) or any(
+        len(part) > 1 and part[1] == ":" for part in normalized_parts
+    )
+    if is_absolute_like or ".." in normalized_parts:
+        return "Path traversal is not allowed"
+    return None
+
+
+@dataclass(frozen=True, slots=True)
 class InstallationContext:
     """Context for installation source.
 
@@ -57,7 +92,7 @@ class InstallationContext:
     git_ref: GitRef | None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class InstallRequest:
     """Installation request parameters.
 
@@ -76,35 +111,47 @@ class InstallRequest:
     no_deps: bool = False
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ScriptInstallOptions:
     """Internal options for script installation.
 
     Used internally to pass processed options to installation methods.
     """
 
-    dependencies: list[str]
-    install_directory: Path
-    no_symlink: bool
-    exact: bool | None
-    add_source_package: str | None
-    alias: str | None
+    # Includes source_package, so every script gets the same list
+    dependencies: tuple[str, ...]
+    # Resolved --add-source-package name (the repo directory name when given without a value)
+    source_package: str | None
+    # Shared by every script in the install() call, so it is built once
+    install_config: InstallConfig
+    # One timestamp for every script installed by the same install() call
+    installed_at: datetime = field(default_factory=datetime.now)
 
 
 class InstallHandler:
     """Handles script installation logic."""
 
-    def __init__(self, config: Config, console: Console) -> None:
+    def __init__(
+        self,
+        config: Config,
+        console: Console,
+        state_manager: StateManager | None = None,
+    ) -> None:
         """
         Initialize install handler.
 
         Args:
             config: Application configuration
             console: Rich console for output
+            state_manager: Shared state manager (created from config when omitted)
         """
         self.config = config
         self.console = console
-        self.state_manager = StateManager(config.state_file)
+        self.state_manager = state_manager if state_manager is not None else StateManager(config.state_file)
+        # Set after the first successful git check; import runs many installs through one handler
+        self._git_verified = False
+        # TinyDB is not thread-safe; concurrent installs record their state one at a time
+        self._state_lock = threading.Lock()
 
     def install(
         self,
@@ -123,9 +170,10 @@ class InstallHandler:
         Returns:
             List of (script_name, success, location_or_error) tuples
         """
-        # Detect and validate source type
-        is_local = is_local_directory(source)
+        # Detect and validate source type. A Git URL wins (as it did when both were checked),
+        # and recognising one needs no filesystem access, so the directory stat runs only otherwise.
         is_git = is_git_url(source)
+        is_local = not is_git and is_local_directory(source)
 
         if not is_local and not is_git:
             self.console.print(f"[red]Error:[/red] Invalid source: {source}")
@@ -138,6 +186,9 @@ class InstallHandler:
             self.console.print(error_msg)
             raise ValueError("--add-source-package requires --copy-parent-dir for local sources")
 
+        # Repeated --script values would otherwise run concurrently against the same file
+        scripts = tuple(dict.fromkeys(scripts))
+
         # Check for existing installations
         if not self._check_existing_scripts(scripts, request.force):
             return []
@@ -160,6 +211,13 @@ class InstallHandler:
                 request.with_deps, repo_path, source_path, request.verbose
             )
 
+        # Resolve the source package once; every script gets the same name and dependency list
+        source_package = None
+        if request.add_source_package is not None:
+            source_package = request.add_source_package or repo_path.name
+            if source_package not in dependencies:
+                dependencies = [*dependencies, source_package]
+
         # Determine installation directory
         install_directory = request.install_dir or self.config.install_dir
         ensure_dir(install_directory)
@@ -176,16 +234,38 @@ class InstallHandler:
             git_ref=git_ref,
         )
         options = ScriptInstallOptions(
-            dependencies=dependencies,
-            install_directory=install_directory,
-            no_symlink=request.no_symlink,
-            exact=request.exact,
-            add_source_package=request.add_source_package,
-            alias=request.alias,
+            dependencies=tuple(dependencies),
+            source_package=source_package,
+            install_config=InstallConfig(
+                install_dir=install_directory,
+                auto_chmod=self.config.auto_chmod,
+                auto_symlink=not request.no_symlink and self.config.auto_symlink,
+                verify_after_install=self.config.verify_after_install,
+                use_exact=request.exact if request.exact is not None else self.config.use_exact_flag,
+                script_alias=request.alias,
+            ),
         )
 
-        # Install scripts
-        return [self._install_single_script(script_name, context, options) for script_name in scripts]
+        # Install scripts, recording them in state with one write once all are done
+        with self.state_manager.batch():
+            if len(scripts) <= 1:
+                return [self._install_single_script(script_name, context, options) for script_name in scripts]
+
+            # Each install mostly waits on uv subprocesses, so overlap them; map keeps results in input order.
+            # Rich allows a single live display, so one spinner covers the batch instead of one per script.
+            total = len(scripts)
+            completed = itertools.count(1)
+            with (
+                progress_spinner(f"Installing scripts (0/{total})...", self.console) as (progress, task),
+                ThreadPoolExecutor(max_workers=min(total, INSTALL_MAX_WORKERS)) as executor,
+            ):
+
+                def install_one(script_name: str) -> tuple[str, bool, Path | None | str]:
+                    result = self._install_single_script(script_name, context, options, show_spinner=False)
+                    progress.update(task, description=f"Installing scripts ({next(completed)}/{total})...")
+                    return result
+
+                return list(executor.map(install_one, scripts))
 
     def _check_existing_scripts(self, scripts: tuple[str, ...], force: bool) -> bool:
         """
@@ -198,11 +278,14 @@ class InstallHandler:
         Returns:
             True if should proceed, False if cancelled
         """
-        existing_scripts = [
-            script_name for script_name in scripts if self.state_manager.get_script(script_name)
-        ]
+        # Existing installations only matter for the prompt, so --force skips the state read
+        if force:
+            return True
 
-        if existing_scripts and not force:
+        installed = self.state_manager.get_existing_names(list(scripts))
+        existing_scripts = [script_name for script_name in scripts if script_name in installed]
+
+        if existing_scripts:
             script_list = ", ".join(existing_scripts)
             self.console.print(f"[yellow]Warning:[/yellow] Scripts already installed: {script_list}")
             if not prompt_confirm("Overwrite existing installations?", default=False):
@@ -225,7 +308,9 @@ class InstallHandler:
         repo_name = get_repo_name_from_url(git_ref.base_url)
         repo_path = self.config.repo_dir / repo_name
 
-        handle_git_error(self.console, lambda: verify_git_available())
+        if not self._git_verified:
+            handle_git_error(self.console, verify_git_available)
+            self._git_verified = True
 
         with progress_spinner("Cloning/updating repository...", self.console):
             handle_git_error(
@@ -265,11 +350,11 @@ class InstallHandler:
         """
         source_path = expand_path(source)
 
-        # Validate source path
-        if not source_path.exists():
-            self.console.print(f"[red]Error:[/red] Source path does not exist: {source_path}")
-            raise FileNotFoundError(f"Source path does not exist: {source_path}")
+        # Validate source path; exists() only runs to pick the error for a non-directory
         if not source_path.is_dir():
+            if not source_path.exists():
+                self.console.print(f"[red]Error:[/red] Source path does not exist: {source_path}")
+                raise FileNotFoundError(f"Source path does not exist: {source_path}")
             self.console.print(f"[red]Error:[/red] Source path is not a directory: {source_path}")
             raise NotADirectoryError(f"Source path is not a directory: {source_path}")
 
@@ -293,6 +378,10 @@ class InstallHandler:
         dir_name = sanitize_directory_name(source_path.name)
         repo_path = self.config.repo_dir / dir_name
 
+        # Re-installing from the managed copy itself: the files are already in place
+        if source_path.resolve() == repo_path.resolve():
+            return repo_path
+
         if repo_path.exists():
             self.console.print(f"[yellow]Warning:[/yellow] Directory already exists: {repo_path}")
             self.console.print("Existing files will be overwritten.")
@@ -356,6 +445,7 @@ class InstallHandler:
         script_name: str,
         context: InstallationContext,
         options: ScriptInstallOptions,
+        show_spinner: bool = True,
     ) -> tuple[str, bool, Path | None | str]:
         """Install a single script.
 
@@ -363,68 +453,48 @@ class InstallHandler:
             script_name: Name of the script to install
             context: Installation source context
             options: Installation configuration options
+            show_spinner: Show a per-script spinner (off when the caller shows one for a batch)
 
         Returns:
             Tuple of (script_name, success, symlink_path_or_error)
         """
         # Validate script_name to prevent path traversal
-        try:
-            validate_filepath(script_name, platform="auto")
-        except ValidationError as e:
-            self.console.print(f"[red]Error:[/red] Invalid script name '{script_name}': {e}")
-            return (script_name, False, f"Invalid script name: {e}")
-
-        normalized_parts = Path(script_name.replace("\\", "/")).parts
-        is_absolute_like = (
-            Path(script_name).is_absolute()
-            or script_name.startswith(("/", "\\"))
-            or (bool(normalized_parts) and normalized_parts[0].endswith(":"))
-        )
-        if is_absolute_like or ".." in normalized_parts:
-            error = "Path traversal is not allowed"
+        error = _validate_script_name(script_name)
+        if error is not None:
             self.console.print(f"[red]Error:[/red] Invalid script name '{script_name}': {error}")
             return (script_name, False, f"Invalid script name: {error}")
 
         # For local sources without copy-parent-dir, copy script from source
         if context.is_local and not context.copy_parent_dir:
             assert context.source_path is not None
-            source_script = context.source_path / script_name
             try:
                 script_path = copy_script_file(context.source_path, script_name, context.repo_path)
             except (FileNotFoundError, IsADirectoryError):
+                source_script = context.source_path / script_name
                 self.console.print(f"[red]Error:[/red] Script '{script_name}' not found at: {source_script}")
                 return (script_name, False, "Not found")
         else:
+            # A successful copy above already implies the script exists
             script_path = context.repo_path / script_name
-
-        # Check if script exists
-        if not script_path.exists():
-            self.console.print(f"[red]Error:[/red] Script '{script_name}' not found at: {script_path}")
-            return (script_name, False, "Not found")
+            if not script_path.exists():
+                self.console.print(f"[red]Error:[/red] Script '{script_name}' not found at: {script_path}")
+                return (script_name, False, "Not found")
 
         # Track dependencies for state and for uv add --script
         all_deps = list(options.dependencies)
 
         try:
-            with progress_spinner(f"Installing {script_name}...", self.console):
+            spinner = (
+                progress_spinner(f"Installing {script_name}...", self.console)
+                if show_spinner
+                else nullcontext()
+            )
+            with spinner:
                 # Add source package if requested
-                if options.add_source_package is not None:
-                    pkg_name = (
-                        options.add_source_package if options.add_source_package else context.repo_path.name
-                    )
-                    add_package_source(script_path, pkg_name, context.repo_path)
-                    if pkg_name not in all_deps:
-                        all_deps.append(pkg_name)
-
-                install_config = InstallConfig(
-                    install_dir=options.install_directory,
-                    auto_chmod=self.config.auto_chmod,
-                    auto_symlink=not options.no_symlink and self.config.auto_symlink,
-                    verify_after_install=self.config.verify_after_install,
-                    use_exact=options.exact if options.exact is not None else self.config.use_exact_flag,
-                    script_alias=options.alias,
-                )
-                symlink_path, shadow_warning = install_script(script_path, all_deps, install_config)
+                if options.source_package is not None:
+                    add_package_source(script_path, options.source_package, context.repo_path)
+
+                symlink_path, shadow_warning = install_script(script_path, all_deps, options.install_config)
 
             # Show shadow warning if any
             if shadow_warning:
@@ -438,7 +508,7 @@ class InstallHandler:
                     source_url=context.git_ref.base_url,
                     ref=context.actual_ref,
                     ref_type=context.git_ref.ref_type,
-                    installed_at=datetime.now(),
+                    installed_at=options.installed_at,
                     repo_path=context.repo_path,
                     symlink_path=symlink_path,
                     dependencies=all_deps,
@@ -448,14 +518,15 @@ class InstallHandler:
                 script_info = ScriptInfo(
                     name=script_name,
                     source_type=SourceType.LOCAL,
-                    installed_at=datetime.now(),
+                    installed_at=options.installed_at,
                     repo_path=context.repo_path,
                     symlink_path=symlink_path,
                     dependencies=all_deps,
                     source_path=context.source_path,
                     copy_parent_dir=context.copy_parent_dir,
                 )
-            self.state_manager.add_script(script_info)
+            with self._state_lock:
+                self.state_manager.add_script(script_info)
 
             return (script_name, True, symlink_path)
 
@@ -11,17 +11,23 @@ from ..utils import prompt_confirm
 class RemoveHandler:
     """Handles script removal logic."""
 
-    def __init__(self, config: Config, console: Console) -> None:
+    def __init__(
+        self,
+        config: Config,
+        console: Console,
+        state_manager: StateManager | None = None,
+    ) -> None:
         """
         Initialize remove handler.
 
         Args:
             config: Application configuration
             console: Rich console for output
+            state_manager: Shared state manager (created from config when omitted)
         """
         self.config = config
         self.console = console
-        self.state_manager = StateManager(config.state_file)
+        self.state_manager = state_manager if state_manager is not None else StateManager(config.state_file)
 
     def remove(self, script_name: str, clean_repo: bool, force: bool) -> None:
         """
@@ -1,12 +1,16 @@
 """Update command handlers."""
 
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime
 from pathlib import Path
 
 from rich.console import Console
 
 from ..config import Config
-from ..constants import SourceType
+from ..constants import REMOTE_CHECK_MAX_WORKERS, UPDATE_MAX_WORKERS, SourceType
 from ..deps import resolve_dependencies
 from ..display import format_local_change_label
 from ..git_manager import (
@@ -35,17 +39,27 @@ from ..utils import copy_directory_contents, copy_script_file, handle_git_error,
 class UpdateHandler:
     """Handles script update logic."""
 
-    def __init__(self, config: Config, console: Console) -> None:
+    def __init__(
+        self,
+        config: Config,
+        console: Console,
+        state_manager: StateManager | None = None,
+    ) -> None:
         """
         Initialize update handler.
 
         Args:
             config: Application configuration
             console: Rich console for output
+            state_manager: Shared state manager (created from config when omitted)
         """
         self.config = config
         self.console = console
-        self.state_manager = StateManager(config.state_file)
+        self.state_manager = state_manager if state_manager is not None else StateManager(config.state_file)
+        # Remote commit hashes prefetched by update_all, keyed by (source_url, ref)
+        self._remote_commit_hashes: dict[tuple[str, str], str | GitError] = {}
+        # TinyDB is not thread-safe; concurrent updates record their state one at a time
+        self._state_lock = threading.Lock()
 
     def update(
         self,
@@ -80,7 +94,7 @@ class UpdateHandler:
             if script_info.source_type == SourceType.LOCAL:
                 return self._local_skip_dry_run_result(display_name)
 
-            handle_git_error(self.console, lambda: verify_git_available())
+            handle_git_error(self.console, verify_git_available)
             return self._build_git_dry_run_result(script_info, force, refresh_deps)
 
         # Branch based on source type (use actual script name from state, not user input)
@@ -123,38 +137,145 @@ class UpdateHandler:
             else:
                 self.console.print(f"Updating {len(scripts)} script(s)...")
 
-        results = []
-        git_checked = False
+        # Verify git available once, then check all remotes up-front
+        if any(script_info.source_type == SourceType.GIT for script_info in scripts):
+            handle_git_error(self.console, verify_git_available)
+            # Forced dry runs report "would update" without asking the remote
+            if not dry_run or not (force or refresh_deps):
+                self._remote_commit_hashes = self._prefetch_remote_commit_hashes(scripts)
 
-        for script_info in scripts:
-            display_name = script_info.display_name
+        try:
+            return self._update_all_scripts(scripts, force, exact, refresh_deps, dry_run)
+        finally:
+            self._remote_commit_hashes = {}
 
-            # Skip local scripts (they need manual source updates)
-            if script_info.source_type == SourceType.LOCAL:
-                if dry_run:
-                    results.append(self._local_skip_dry_run_result(display_name))
-                else:
-                    results.append(self._local_skip_result(display_name))
-                continue
+    def _update_all_scripts(
+        self,
+        scripts: list[ScriptInfo],
+        force: bool,
+        exact: bool | None,
+        refresh_deps: bool,
+        dry_run: bool,
+    ) -> list[tuple[str, str] | tuple[str, str, str]]:
+        """
+        Update or check every script, collecting per-script results in input order.
+
+        Scripts sharing a repository are handled one after another, since they share one
+        working tree; different repositories are handled concurrently.
+        """
+        repo_groups: dict[Path, list[int]] = {}
+        for index, script_info in enumerate(scripts):
+            repo_groups.setdefault(script_info.repo_path, []).append(index)
+
+        # Record updated scripts in state with one write once all are done
+        with self.state_manager.batch():
+            if len(repo_groups) <= 1:
+                return [
+                    self._update_one_script(script_info, force, exact, refresh_deps, dry_run)
+                    for script_info in scripts
+                ]
+
+            # Rich allows a single live display, so one spinner covers the batch instead of one per script
+            results: dict[int, tuple[str, str] | tuple[str, str, str]] = {}
+            action = "Checking" if dry_run else "Updating"
+            total = len(scripts)
+            completed = itertools.count(1)
+            with (
+                progress_spinner(f"{action} scripts (0/{total})...", self.console) as (progress, task),
+                ThreadPoolExecutor(max_workers=min(len(repo_groups), UPDATE_MAX_WORKERS)) as executor,
+            ):
+
+                def update_group(indices: list[int]) -> None:
+                    for index in indices:
+                        results[index] = self._update_one_script(
+                            scripts[index], force, exact, refresh_deps, dry_run, show_spinner=False
+                        )
+                        progress.update(task, description=f"{action} scripts ({next(completed)}/{total})...")
+
+                # Consume the iterator so an unexpected worker exception propagates
+                list(executor.map(update_group, repo_groups.values()))
+
+        return [results[index] for index in range(len(scripts))]
+
+    def _update_one_script(
+        self,
+        script_info: ScriptInfo,
+        force: bool,
+        exact: bool | None,
+        refresh_deps: bool,
+        dry_run: bool,
+        show_spinner: bool = True,
+    ) -> tuple[str, str] | tuple[str, str, str]:
+        """Update or check one script for update_all, turning Git/installer errors into statuses."""
+        display_name = script_info.display_name
+
+        # Skip local scripts (they need manual source updates)
+        if script_info.source_type == SourceType.LOCAL:
+            if dry_run:
+                return self._local_skip_dry_run_result(display_name)
+            return self._local_skip_result(display_name)
+
+        try:
+            if dry_run:
+                return self._build_git_dry_run_result(script_info, force, refresh_deps)
+            status = self._update_git_script_internal(
+                script_info, force, exact, refresh_deps, show_spinner=show_spinner
+            )
+            return (display_name, status)
+        except (GitError, ScriptInstallerError) as e:
+            if dry_run:
+                return (display_name, make_error_status(str(e)), "Unknown")
+            return (display_name, make_error_status(str(e)))
+
+    @staticmethod
+    def _prefetch_remote_commit_hashes(
+        scripts: list[ScriptInfo],
+    ) -> dict[tuple[str, str], str | GitError]:
+        """
+        Look up remote commit hashes for all branch-tracking Git scripts concurrently.
 
-            # Verify git available once
-            if not git_checked:
-                handle_git_error(self.console, lambda: verify_git_available())
-                git_checked = True
+        Each distinct (source_url, ref) pair is queried once. Failures are stored
+        rather than raised so they surface on the script that needs the hash.
+
+        Args:
+            scripts: Installed scripts
+
+        Returns:
+            Mapping of (source_url, ref) to the remote commit hash or the GitError raised
+        """
+        remotes = list(
+            dict.fromkeys(
+                (script_info.source_url, script_info.ref)
+                for script_info in scripts
+                if script_info.source_type == SourceType.GIT
+                and script_info.source_url
+                and script_info.ref
+                and script_info.ref_type not in ("tag", "commit")
+            )
+        )
+        if not remotes:
+            return {}
 
+        def _lookup(remote: tuple[str, str]) -> str | GitError:
             try:
-                if dry_run:
-                    results.append(self._build_git_dry_run_result(script_info, force, refresh_deps))
-                else:
-                    status = self._update_git_script_internal(script_info, force, exact, refresh_deps)
-                    results.append((display_name, status))
-            except (GitError, ScriptInstallerError) as e:
-                if dry_run:
-                    results.append((display_name, make_error_status(str(e)), "Unknown"))
-                else:
-                    results.append((display_name, make_error_status(str(e))))
+                return get_remote_commit_hash(*remote)
+            except GitError as e:
+                return e
 
-        return results
+        with ThreadPoolExecutor(max_workers=min(REMOTE_CHECK_MAX_WORKERS, len(remotes))) as executor:
+            return dict(zip(remotes, executor.map(_lookup, remotes), strict=True))
+
+    def _get_remote_commit_hash(self, script_info: ScriptInfo) -> str:
+        """Return the remote commit hash for a script, preferring a prefetched result."""
+        assert script_info.source_url is not None
+        assert script_info.ref is not None
+
+        prefetched = self._remote_commit_hashes.get((script_info.source_url, script_info.ref))
+        if prefetched is None:
+            return get_remote_commit_hash(script_info.source_url, script_info.ref)
+        if isinstance(prefetched, GitError):
+            raise GitError(str(prefetched))
+        return prefetched
 
     def _update_local_script(
         self, script_info: ScriptInfo, exact: bool | None, refresh_deps: bool = False
@@ -206,7 +327,7 @@ class UpdateHandler:
         assert script_info.source_url is not None
         assert script_info.ref is not None
 
-        handle_git_error(self.console, lambda: verify_git_available())
+        handle_git_error(self.console, verify_git_available)
         display_name = script_info.display_name
 
         try:
@@ -216,9 +337,14 @@ class UpdateHandler:
             return (display_name, make_error_status(str(e)))
 
     def _update_git_script_internal(
-        self, script_info: ScriptInfo, force: bool, exact: bool | None, refresh_deps: bool = False
+        self,
+        script_info: ScriptInfo,
+        force: bool,
+        exact: bool | None,
+        refresh_deps: bool = False,
+        show_spinner: bool = True,
     ) -> str:
-        """Internal method to update a Git script."""
+        """Internal method to update a Git script (show_spinner is off when update_all shows one)."""
         assert script_info.source_url is not None
         assert script_info.ref is not None
 
@@ -229,10 +355,17 @@ class UpdateHandler:
             # Pinned refs don't get updates - they're intentionally fixed
             return make_pinned_status(script_info.ref)
 
+        remote_commit_hash = None
         if not is_pinned and not force and not refresh_deps:
-            remote_commit_hash = get_remote_commit_hash(script_info.source_url, script_info.ref)
+            remote_commit_hash = self._get_remote_commit_hash(script_info)
             if remote_commit_hash == script_info.commit_hash:
                 return UPDATE_STATUS_UP_TO_DATE
+        elif not is_pinned:
+            # Forced runs only reuse the update-all prefetch; a fresh ls-remote would just
+            # add a round-trip in front of the fetch that follows anyway
+            prefetched = self._remote_commit_hashes.get((script_info.source_url, script_info.ref))
+            if isinstance(prefetched, str):
+                remote_commit_hash = prefetched
 
         local_change_state = get_local_change_state(script_info.repo_path, script_info.name)
         if local_change_state == "blocking":
@@ -244,16 +377,28 @@ class UpdateHandler:
             if not cleaned:
                 raise GitError("Failed to clear uv-managed local script changes before update")
 
-        with progress_spinner("Updating repository...", self.console):
-            clone_or_update(
-                script_info.source_url,
-                script_info.ref,
-                script_info.repo_path,
-                depth=self.config.clone_depth,
-            )
+        # A forced update or dependency refresh of a clone already at the remote commit needs no fetch
+        new_commit_hash = None
+        if remote_commit_hash is not None and script_info.repo_path.exists():
+            local_commit_hash = get_current_commit_hash(script_info.repo_path)
+            if local_commit_hash == remote_commit_hash:
+                new_commit_hash = local_commit_hash
 
-        # Check if there are updates
-        new_commit_hash = get_current_commit_hash(script_info.repo_path)
+        if new_commit_hash is None:
+            spinner = (
+                progress_spinner("Updating repository...", self.console) if show_spinner else nullcontext()
+            )
+            with spinner:
+                clone_or_update(
+                    script_info.source_url,
+                    script_info.ref,
+                    script_info.repo_path,
+                    depth=self.config.clone_depth,
+                    ref_type=script_info.ref_type,
+                )
+
+            # Check if there are updates
+            new_commit_hash = get_current_commit_hash(script_info.repo_path)
 
         # For non-pinned refs, get the actual current branch
         if not is_pinned:
@@ -326,7 +471,8 @@ class UpdateHandler:
         script_info.dependencies = dependencies
         script_info.installed_at = datetime.now()
         script_info.symlink_path = symlink_path
-        self.state_manager.add_script(script_info)
+        with self._state_lock:
+            self.state_manager.add_script(script_info)
 
     def _resolve_dependencies_for_update(
         self,
@@ -363,7 +509,7 @@ class UpdateHandler:
         if force or refresh_deps:
             status = UPDATE_STATUS_WOULD_UPDATE
         else:
-            remote_commit_hash = get_remote_commit_hash(script_info.source_url, script_info.ref)
+            remote_commit_hash = self._get_remote_commit_hash(script_info)
             if remote_commit_hash == script_info.commit_hash:
                 status = UPDATE_STATUS_UP_TO_DATE
             else:
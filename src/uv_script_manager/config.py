@@ -1,9 +1,11 @@
 """Configuration management."""
 
+import copy
 import logging
 import os
 import shutil
 import tomllib
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -26,12 +28,19 @@ logger = logging.getLogger(__name__)
 DEFAULT_CONFIG_TEMPLATE_PATH = Path(__file__).with_name("config.toml")
 
 
-def _load_default_template() -> dict[str, Any]:
-    """Load the repository default config template."""
+@cache
+def _parse_default_template() -> dict[str, Any]:
+    """Parse the bundled default config template once per process."""
     with open(DEFAULT_CONFIG_TEMPLATE_PATH, "rb") as f:
         return tomllib.load(f)
 
 
+def _load_default_template() -> dict[str, Any]:
+    """Load the repository default config template."""
+    # Callers merge into the result, so hand out a copy of the cached parse
+    return copy.deepcopy(_parse_default_template())
+
+
 def _copy_default_config(config_path: Path) -> None:
     """Copy repository template to the user config path."""
     ensure_dir(config_path.parent)
@@ -174,42 +183,65 @@ def create_default_config() -> Config:
     return Config.model_validate(_load_default_template())
 
 
-def load_config(config_path: Path | None = None) -> Config:
+@lru_cache(maxsize=4)
+def _load_config_file(config_path: Path, mtime_ns: int, size: int) -> Config:
+    """
+    Parse, migrate, and validate a config file.
+
+    Cached per (path, mtime, size), so repeated loads in one process reuse the parsed result.
+
+    Args:
+        config_path: Existing config file path
+        mtime_ns: File modification time, part of the cache key
+        size: File size in bytes, part of the cache key
+
+    Returns:
+        Config instance with validated values
+    """
+    with open(config_path, "rb") as f:
+        data = tomllib.load(f)
+
+    data, was_migrated = run_config_migrations(data)
+    if was_migrated:
+        try:
+            _save_config(config_path, data)
+        except (OSError, PermissionError) as e:
+            logger.warning(f"Could not save migrated config to {config_path}: {e}")
+
+    merged_values = merge_config_data(_load_default_template(), data)
+    return Config.model_validate(merged_values)
+
+
+def load_config(config_path: Path | None = None, *, create_if_missing: bool = True) -> Config:
     """
     Load configuration from TOML file using Pydantic validation.
 
     Args:
         config_path: Optional custom config path
+        create_if_missing: Copy the default config to config_path when it does not exist
 
     Returns:
         Config instance with validated values
 
     Raises:
+        FileNotFoundError: If config_path does not exist and create_if_missing is False
         ValueError: If config validation fails
     """
     if config_path is None:
         config_path = get_config_path()
 
-    defaults = _load_default_template()
-
-    if not config_path.exists():
+    try:
+        stat_result = config_path.stat()
+    except FileNotFoundError:
+        if not create_if_missing:
+            raise FileNotFoundError(f"Config file not found: {config_path}") from None
         try:
             _copy_default_config(config_path)
+            stat_result = config_path.stat()
         except (OSError, PermissionError) as e:
             logger.warning(f"Could not copy default config to {config_path}: {e}")
+            return Config.model_validate(_load_default_template())
 
-    if config_path.exists():
-        with open(config_path, "rb") as f:
-            data = tomllib.load(f)
-
-        data, was_migrated = run_config_migrations(data)
-        if was_migrated:
-            try:
-                _save_config(config_path, data)
-            except (OSError, PermissionError) as e:
-                logger.warning(f"Could not save migrated config to {config_path}: {e}")
-
-        merged_values = merge_config_data(defaults, data)
-        return Config.model_validate(merged_values)
-
-    return Config.model_validate(defaults)
+    # Keyed on mtime/size so edits to the file are picked up without re-parsing unchanged files
+    config = _load_config_file(config_path, stat_result.st_mtime_ns, stat_result.st_size)
+    return config.model_copy(deep=True)
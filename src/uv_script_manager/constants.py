@@ -43,3 +43,12 @@ JSON_OUTPUT_INDENT = 2
 
 # Git configuration
 GIT_SHORT_HASH_LENGTH = 8
+
+# Maximum concurrent `git ls-remote` checks when updating all scripts
+REMOTE_CHECK_MAX_WORKERS = 8
+
+# Maximum scripts installed concurrently from one source
+INSTALL_MAX_WORKERS = 4
+
+# Maximum repositories updated concurrently by update-all
+UPDATE_MAX_WORKERS = 4
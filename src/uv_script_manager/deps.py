@@ -1,39 +1,26 @@
 """Dependency management."""
 
 import warnings
+from functools import lru_cache
 from pathlib import Path
 
 import requirements
 from pathvalidate import ValidationError, validate_filepath
 
 
-def parse_requirements_file(requirements_path: Path) -> list[str]:
+@lru_cache(maxsize=32)
+def _parse_requirements_cached(requirements_path: Path, mtime_ns: int, size: int) -> tuple[str, ...]:
     """
-    Parse requirements.txt file using requirements-parser library.
-
-    Handles:
-    - `-r` includes (recursive)
-    - `-e` editable installs
-    - URL/file requirements
-    - Environment markers
-    - Extras and version specifiers
-
-    Notes:
-    - `-c` constraints and index options are ignored (not installable dependencies)
-    - Unnamed requirements (for example direct URLs) are preserved from the original line
+    Parse a requirements file, cached per (path, mtime, size).
 
     Args:
-        requirements_path: Path to requirements.txt
+        requirements_path: Existing requirements file path
+        mtime_ns: File modification time, part of the cache key
+        size: File size in bytes, part of the cache key
 
     Returns:
-        List of dependency strings
-
-    Raises:
-        FileNotFoundError: If requirements file doesn't exist
+        Tuple of dependency strings
     """
-    if not requirements_path.exists():
-        raise FileNotFoundError(f"Requirements file not found: {requirements_path}")
-
     dependencies = []
     ignored_prefixes = ("-c", "--constraint", "--index-url", "--extra-index-url", "--find-links")
 
@@ -58,7 +45,42 @@ def parse_requirements_file(requirements_path: Path) -> list[str]:
                     continue
                 dependencies.append(line)
 
-    return dependencies
+    return tuple(dependencies)
+
+
+def parse_requirements_file(requirements_path: Path) -> list[str]:
+    """
+    Parse requirements.txt file using requirements-parser library.
+
+    Handles:
+    - `-r` includes (recursive)
+    - `-e` editable installs
+    - URL/file requirements
+    - Environment markers
+    - Extras and version specifiers
+
+    Notes:
+    - `-c` constraints and index options are ignored (not installable dependencies)
+    - Unnamed requirements (for example direct URLs) are preserved from the original line
+    - Results are reused within the process while the file's mtime and size are unchanged
+      (files pulled in with `-r` are not part of that check), so installing several scripts
+      from one repository parses its requirements once
+
+    Args:
+        requirements_path: Path to requirements.txt
+
+    Returns:
+        List of dependency strings
+
+    Raises:
+        FileNotFoundError: If requirements file doesn't exist
+    """
+    try:
+        stat_result = requirements_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Requirements file not found: {requirements_path}") from None
+
+    return list(_parse_requirements_cached(requirements_path, stat_result.st_mtime_ns, stat_result.st_size))
 
 
 def parse_dependencies_string(deps_str: str) -> list[str]:
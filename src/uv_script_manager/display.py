@@ -1,6 +1,7 @@
 """Display functions for CLI output."""
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import cast
 
@@ -23,6 +24,15 @@ from .update_status import (
 )
 
 
+@lru_cache(maxsize=256)
+def _shorten_source_url(source_url: str) -> str:
+    """Return the last two path segments of a source URL ("owner/repo"), ignoring trailing slashes."""
+    head, sep, tail = source_url.rstrip("/").rpartition("/")
+    if not sep:
+        return source_url
+    return f"{head.rpartition('/')[2]}/{tail}"
+
+
 def _normalize_status_key(status_key: str) -> str:
     """Normalize status aliases to canonical script-status keys."""
     normalized = status_key.strip().lower()
@@ -102,8 +112,7 @@ def get_script_source_display(
             return missing_git
         if not shorten_git:
             return script.source_url
-        source_parts = script.source_url.rstrip("/").split("/")
-        return "/".join(source_parts[-2:]) if len(source_parts) >= 2 else script.source_url
+        return _shorten_source_url(script.source_url)
     return str(script.source_path) if script.source_path else "local"
 
 
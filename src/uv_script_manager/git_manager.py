@@ -1,6 +1,7 @@
 """Git operations."""
 
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
@@ -64,11 +65,14 @@ def parse_git_url(url: str) -> GitRef:
     """
     # Extract ref markers before parsing.
     base_url, ref_type, ref_value = split_source_ref(url)
+    # GitRef is mutable, so only the normalized URL is cached and each call gets its own model
+    return GitRef(base_url=_normalize_git_url(base_url), ref_type=ref_type, ref_value=ref_value)
 
-    parsed = parse_git_url_base(base_url)
-    # Convert to HTTPS format and remove .git suffix for consistency
-    normalized_url = parsed.url2https.removesuffix(".git")
-    return GitRef(base_url=normalized_url, ref_type=ref_type, ref_value=ref_value)
+
+@lru_cache(maxsize=256)
+def _normalize_git_url(base_url: str) -> str:
+    """Convert a Git URL to HTTPS form without the .git suffix, for consistency."""
+    return parse_git_url_base(base_url).url2https.removesuffix(".git")
 
 
 def clone_repository(
@@ -103,9 +107,10 @@ def clone_repository(
 
     try:
         run_command(cmd, capture_output=True, check=True)
-        # For commit refs, fetch the specific commit and checkout after clone
+        # For commit refs, fetch the specific commit and checkout after clone.
+        # Without --depth the fetch would pull the commit's whole ancestry into the shallow clone.
         if ref and is_commit:
-            run_command(["git", "fetch", "origin", ref], cwd=target_dir, check=True)
+            run_command(["git", "fetch", "--depth", str(depth), "origin", ref], cwd=target_dir, check=True)
             checkout_ref(target_dir, ref)
     except subprocess.CalledProcessError as e:
         raise GitError(f"Failed to clone repository: {e.stderr}") from e
@@ -343,6 +348,27 @@ def get_remote_commit_hash(url: str, ref: str = "HEAD") -> str:
         raise GitError(f"Failed to get remote commit hash: {e.stderr}") from e
 
 
+def _head_matches_commit(repo_path: Path, commit: str) -> bool:
+    """
+    Check whether a repository's HEAD is the given commit.
+
+    Args:
+        repo_path: Path to repository
+        commit: Full or abbreviated commit hash
+
+    Returns:
+        True if HEAD resolves to that commit, False otherwise (including on git errors)
+    """
+    # Without its own .git, rev-parse would answer for an enclosing repository
+    if not (repo_path / ".git").exists():
+        return False
+    try:
+        result = run_command(["git", "rev-parse", "HEAD"], cwd=repo_path, check=True)
+    except subprocess.CalledProcessError:
+        return False
+    return result.stdout.strip().startswith(commit.lower())
+
+
 def clone_or_update(
     url: str,
     ref: str | None,
@@ -364,6 +390,9 @@ def clone_or_update(
         GitError: If operation fails
     """
     if target_dir.exists():
+        # A commit never moves, so a checkout already at it needs no fetch
+        if ref and ref_type == "commit" and _head_matches_commit(target_dir, ref):
+            return
         # Repository exists, update it with the specific ref
         update_repository(target_dir, ref)
     else:
@@ -19,9 +19,8 @@ def infer_ref_type(ref: str | None) -> RefType:
         return "default"
     if is_commit_hash(ref):
         return "commit"
-    if ref.startswith("v") and len(ref) > 1 and ref[1].isdigit():
-        return "tag"
-    if ref[0].isdigit():
+    # "1.2.0" or "v1.2.0"
+    if ref[:1].isdigit() or (ref[:1] == "v" and ref[1:2].isdigit()):
         return "tag"
     return "branch"
 
@@ -38,7 +38,7 @@ class ScriptInstallerError(Exception):
     pass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class InstallConfig:
     """Configuration for script installation.
 
@@ -1,10 +1,18 @@
 """State management."""
 
+import json
+import os
+import stat
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field
 from tinydb import Query, TinyDB
+from tinydb.storages import Storage
 
 from .constants import DB_TABLE_SCRIPTS, SourceType
 from .migrations import MIGRATIONS, MigrationRunner
@@ -50,6 +58,56 @@ class ScriptInfo(BaseModel):
         return str(self.source_path) if self.source_path else "local"
 
 
+class AtomicJSONStorage(Storage):
+    """TinyDB JSON storage that replaces the file atomically on every write.
+
+    TinyDB's JSONStorage rewrites the file in place, so an interrupted write can leave
+    a truncated state file. Writing to a sibling temp file and renaming it over the
+    original means readers only ever see the old or the new contents.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        Create the storage, creating an empty state file if none exists.
+
+        Args:
+            path: Path to the JSON state file
+        """
+        super().__init__()
+        self.path = path
+        # Same as JSONStorage: the file exists from the first open onwards
+        self.path.touch(exist_ok=True)
+
+    def read(self) -> dict[str, dict[str, Any]] | None:
+        """Return the stored data, or None for an empty file so TinyDB initializes it."""
+        with open(self.path, encoding="utf-8") as f:
+            content = f.read()
+        return json.loads(content) if content else None
+
+    def write(self, data: dict[str, dict[str, Any]]) -> None:
+        """Write data to a unique temp file and rename it over the state file.
+
+        The target is resolved first so a symlinked state file keeps its link, and the
+        temp file takes over the original file's permissions before the rename.
+        """
+        target = self.path.resolve()
+        fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=f"{target.name}.", suffix=".tmp")
+        tmp_path = Path(tmp_name)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+                f.flush()
+                os.fsync(f.fileno())
+            try:
+                os.chmod(tmp_path, stat.S_IMODE(target.stat().st_mode))
+            except FileNotFoundError:
+                pass
+            os.replace(tmp_path, target)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+
 class StateManager:
     """Manages state using TinyDB for automatic atomic updates and query support."""
 
@@ -65,8 +123,10 @@ class StateManager:
         self.state_file = state_file
         ensure_dir(state_file.parent)
 
-        self.db = TinyDB(state_file)
+        self.db = TinyDB(state_file, storage=AtomicJSONStorage)
         self.scripts = self.db.table(DB_TABLE_SCRIPTS)
+        # Scripts queued by add_script inside batch(), keyed by name; None outside a batch
+        self._pending_scripts: dict[str, ScriptInfo] | None = None
 
         # Run any pending migrations
         runner = MigrationRunner(self.db, state_file)
@@ -74,11 +134,63 @@ class StateManager:
             runner.run_migrations(MIGRATIONS)
 
     def add_script(self, script: ScriptInfo) -> None:
-        """Add or update script in database."""
+        """Add or update script in database (queued until the block exits inside batch())."""
+        if self._pending_scripts is not None:
+            self._pending_scripts[script.name] = script
+            return
         data = script.model_dump(mode="json")
         Script = Query()
         self.scripts.upsert(data, Script.name == script.name)
 
+    def add_scripts(self, scripts: list[ScriptInfo]) -> None:
+        """
+        Add or update several scripts with at most two database writes.
+
+        TinyDB rewrites the whole state file on every write, so one upsert per script
+        costs one full rewrite each.
+
+        Args:
+            scripts: Scripts to store; existing entries with the same name are updated in place
+        """
+        if not scripts:
+            return
+        Script = Query()
+        existing = self.get_existing_names([script.name for script in scripts])
+
+        updates = []
+        inserts = []
+        for script in scripts:
+            data = script.model_dump(mode="json")
+            if script.name in existing:
+                updates.append((data, Script.name == script.name))
+            else:
+                inserts.append(data)
+
+        if updates:
+            self.scripts.update_multiple(updates)
+        if inserts:
+            self.scripts.insert_multiple(inserts)
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Queue add_script calls and write them together when the block exits.
+
+        Queued scripts are not visible to reads until the block exits. They are written
+        even if the block raises, so completed installs are never lost from state.
+        """
+        if self._pending_scripts is not None:
+            # Already inside a batch; the outer one writes everything
+            yield
+            return
+
+        self._pending_scripts = {}
+        try:
+            yield
+        finally:
+            pending, self._pending_scripts = self._pending_scripts, None
+            self.add_scripts(list(pending.values()))
+
     def remove_script(self, name: str) -> None:
         """Remove script from database."""
         Script = Query()
@@ -90,6 +202,23 @@ class StateManager:
         result = self.scripts.get(Script.name == name)
         return ScriptInfo.model_validate(result) if result else None
 
+    def get_existing_names(self, names: list[str]) -> set[str]:
+        """
+        Return which of the given script names are already in the database.
+
+        Answers with a single read of the state file, where get_script would read it once per name.
+
+        Args:
+            names: Script names to look up
+
+        Returns:
+            Set of names that have a database entry
+        """
+        if not names:
+            return set()
+        Script = Query()
+        return {doc["name"] for doc in self.scripts.search(Script.name.one_of(names))}
+
     def get_script_flexible(self, name: str) -> ScriptInfo | None:
         """
         Get script by name or symlink name.
@@ -102,12 +231,16 @@ class StateManager:
         Returns:
             ScriptInfo if found, None otherwise
         """
-        # Try by name first
-        script = self.get_script(name)
-        if script:
-            return script
-        # Try by symlink
-        return self.get_script_by_symlink(name)
+        # One read of the table for both lookups; a miss on the name would otherwise read it twice
+        docs = self.scripts.all()
+        for doc in docs:
+            if doc.get("name") == name:
+                return ScriptInfo.model_validate(doc)
+        for doc in docs:
+            symlink_path = doc.get("symlink_path")
+            if isinstance(symlink_path, str) and Path(symlink_path).name == name:
+                return ScriptInfo.model_validate(doc)
+        return None
 
     def list_scripts(self) -> list[ScriptInfo]:
         """List all installed scripts."""
@@ -145,6 +278,93 @@ class StateManager:
         )
         return ScriptInfo.model_validate(results[0]) if results else None
 
+    def _check_script(self, script: ScriptInfo) -> tuple[list[str], str | None]:
+        """
+        Check one script's files and symlink, touching each path once.
+
+        Args:
+            script: Script to check
+
+        Returns:
+            Tuple of (validation issues, repair action). The action is "remove" when
+            both the script file and its repository are gone, "unlink_symlink" when
+            only the symlink is broken, or None when no repair applies.
+        """
+        issues = []
+
+        symlink_exists = script.symlink_path.exists() if script.symlink_path else False
+
+        # Check symlink validity
+        if script.symlink_path:
+            if not symlink_exists:
+                issues.append(f"Broken symlink for '{script.name}': {script.symlink_path}")
+            elif not script.symlink_path.is_symlink():
+                issues.append(f"Expected symlink but found file: {script.symlink_path}")
+            else:
+                try:
+                    target = script.symlink_path.resolve()
+                    expected = script.repo_path / script.name
+                    if target != expected:
+                        issues.append(
+                            f"Symlink points to wrong target for '{script.name}': {target} != {expected}"
+                        )
+                except (OSError, RuntimeError):
+                    issues.append(f"Cannot resolve symlink for '{script.name}': {script.symlink_path}")
+
+        # Check script file exists
+        script_file = script.repo_path / script.name
+        script_file_exists = script_file.exists()
+        if not script_file_exists:
+            issues.append(f"Script file missing for '{script.name}': {script_file}")
+
+        # Check repo path exists (implied by an existing script file)
+        repo_path_exists = script_file_exists or script.repo_path.exists()
+        if not repo_path_exists:
+            issues.append(f"Repository directory missing for '{script.name}': {script.repo_path}")
+
+        # Check source_path for local scripts
+        if script.source_type == SourceType.LOCAL and script.source_path:
+            if not script.source_path.exists():
+                issues.append(
+                    f"Source directory missing for local script '{script.name}': {script.source_path}"
+                )
+
+        if not script_file_exists and not repo_path_exists:
+            action = "remove"
+        elif script.symlink_path and not symlink_exists:
+            action = "unlink_symlink"
+        else:
+            action = None
+
+        return issues, action
+
+    def _apply_repairs(self, actions: list[tuple[ScriptInfo, str]], auto_fix: bool) -> dict[str, int]:
+        """Count (and optionally apply) repair actions from _check_script."""
+        report = {"broken_symlinks_removed": 0, "missing_scripts_removed": 0}
+        to_remove = []
+
+        for script, action in actions:
+            # Remove scripts with missing files
+            if action == "remove":
+                to_remove.append(script.name)
+                report["missing_scripts_removed"] += 1
+
+            # Remove broken symlinks
+            elif action == "unlink_symlink" and script.symlink_path:
+                if auto_fix:
+                    try:
+                        script.symlink_path.unlink(missing_ok=True)
+                    except OSError:
+                        pass
+                report["broken_symlinks_removed"] += 1
+
+        # Remove invalid scripts from state
+        if auto_fix:
+            for name in to_remove:
+                self.remove_script(name)
+
+        return report
+
     def validate_state(self) -> list[str]:
         """
         Validate state integrity.
@@ -158,44 +378,7 @@ class StateManager:
         Returns:
             List of validation issues (empty if valid)
         """
-        issues = []
-        scripts = self.list_scripts()
-
-        for script in scripts:
-            # Check symlink validity
-            if script.symlink_path:
-                if not script.symlink_path.exists():
-                    issues.append(f"Broken symlink for '{script.name}': {script.symlink_path}")
-                elif not script.symlink_path.is_symlink():
-                    issues.append(f"Expected symlink but found file: {script.symlink_path}")
-                else:
-                    try:
-                        target = script.symlink_path.resolve()
-                        expected = script.repo_path / script.name
-                        if target != expected:
-                            issues.append(
-                                f"Symlink points to wrong target for '{script.name}': {target} != {expected}"
-                            )
-                    except (OSError, RuntimeError):
-                        issues.append(f"Cannot resolve symlink for '{script.name}': {script.symlink_path}")
-
-            # Check script file exists
-            script_file = script.repo_path / script.name
-            if not script_file.exists():
-                issues.append(f"Script file missing for '{script.name}': {script_file}")
-
-            # Check repo path exists
-            if not script.repo_path.exists():
-                issues.append(f"Repository directory missing for '{script.name}': {script.repo_path}")
-
-            # Check source_path for local scripts
-            if script.source_type == SourceType.LOCAL and script.source_path:
-                if not script.source_path.exists():
-                    issues.append(
-                        f"Source directory missing for local script '{script.name}': {script.source_path}"
-                    )
-
-        return issues
+        return [issue for script in self.list_scripts() for issue in self._check_script(script)[0]]
 
     def repair_state(self, auto_fix: bool = False) -> dict[str, int]:
         """
@@ -210,30 +393,31 @@ class StateManager:
                 'missing_scripts_removed': int,
             }
         """
-        report = {"broken_symlinks_removed": 0, "missing_scripts_removed": 0}
-
-        scripts = self.list_scripts()
-        to_remove = []
-
-        for script in scripts:
-            # Remove scripts with missing files
-            script_file = script.repo_path / script.name
-            if not script_file.exists() and not script.repo_path.exists():
-                to_remove.append(script.name)
-                report["missing_scripts_removed"] += 1
+        actions = []
+        for script in self.list_scripts():
+            _, action = self._check_script(script)
+            if action:
+                actions.append((script, action))
+        return self._apply_repairs(actions, auto_fix)
+
+    def validate_and_repair(self, auto_fix: bool = False) -> tuple[list[str], dict[str, int]]:
+        """
+        Validate state and repair it from the same scan.
 
-            # Remove broken symlinks
-            elif script.symlink_path and not script.symlink_path.exists():
-                if auto_fix:
-                    try:
-                        script.symlink_path.unlink(missing_ok=True)
-                    except OSError:
-                        pass
-                report["broken_symlinks_removed"] += 1
+        Equivalent to validate_state() followed by repair_state(), but every
+        script's paths are checked once and the results reused for both.
 
-        # Remove invalid scripts from state
-        if auto_fix:
-            for name in to_remove:
-                self.remove_script(name)
+        Args:
+            auto_fix: If True, automatically fix issues. If False, return report only.
 
-        return report
+        Returns:
+            Tuple of (validation issues, repair report as returned by repair_state)
+        """
+        issues: list[str] = []
+        actions = []
+        for script in self.list_scripts():
+            script_issues, action = self._check_script(script)
+            issues.extend(script_issues)
+            if action:
+                actions.append((script, action))
+        return issues, self._apply_repairs(actions, auto_fix)
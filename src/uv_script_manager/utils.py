@@ -6,18 +6,17 @@ import shutil
 import subprocess
 from collections.abc import Callable
 from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterator, TypeVar
+from typing import TYPE_CHECKING, Iterator, TypeVar
 
-from giturlparse import parse as parse_git_url_base
-from giturlparse import validate as validate_git_url
-from pathvalidate import sanitize_filename
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.prompt import Confirm
 
 from .refs import split_source_ref
 
+if TYPE_CHECKING:
+    from rich.progress import Progress
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
@@ -50,6 +49,8 @@ def is_git_url(url: str) -> bool:
     Returns:
         True if valid Git URL, False otherwise
     """
+    from giturlparse import validate as validate_git_url
+
     # Remove optional ref suffixes before validation.
     base_url, _, _ = split_source_ref(url)
     return validate_git_url(base_url)
@@ -86,6 +87,8 @@ def sanitize_directory_name(name: str) -> str:
     Returns:
         Sanitized directory name
     """
+    from pathvalidate import sanitize_filename
+
     return sanitize_filename(name, replacement_text="-")
 
 
@@ -113,6 +116,8 @@ def prompt_confirm(message: str, default: bool = False) -> bool:
     Returns:
         True if confirmed, False otherwise
     """
+    from rich.prompt import Confirm
+
     return Confirm.ask(message, default=default)
 
 
@@ -150,6 +155,7 @@ def run_command(
     )
 
 
+@lru_cache(maxsize=256)
 def get_repo_name_from_url(url: str) -> str:
     """
     Generate a repository name from URL.
@@ -167,6 +173,8 @@ def get_repo_name_from_url(url: str) -> str:
     Returns:
         Repository name (format: owner-repo)
     """
+    from giturlparse import parse as parse_git_url_base
+
     base_url, _, _ = split_source_ref(url)
     parsed = parse_git_url_base(base_url)
     return f"{parsed.owner}-{parsed.name}"
@@ -209,7 +217,7 @@ def validate_python_script(script_path: Path) -> bool:
 
 
 @contextmanager
-def progress_spinner(description: str, console: Console) -> Iterator[tuple[Progress, int]]:
+def progress_spinner(description: str, console: Console) -> Iterator[tuple["Progress", int]]:
     """
     Create a progress spinner context manager.
 
@@ -220,6 +228,8 @@ def progress_spinner(description: str, console: Console) -> Iterator[tuple[Progr
     Yields:
         Tuple of (progress, task_id)
     """
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -275,14 +285,23 @@ def copy_directory_contents(source: Path, dest: Path) -> None:
     Raises:
         OSError: If copy operation fails
     """
-    for item in source.iterdir():
-        dest_item = dest / item.name
-        if item.is_dir():
-            if dest_item.exists():
-                safe_rmtree(dest_item)
-            shutil.copytree(item, dest_item)
-        else:
-            shutil.copy2(item, dest_item)
+    # Copying a directory onto itself would delete subdirectories before re-copying them
+    if source.resolve() == dest.resolve():
+        return
+
+    # scandir entries carry the file type from the directory listing, so is_dir() needs no extra stat
+    with os.scandir(source) as entries:
+        for entry in entries:
+            dest_item = dest / entry.name
+            if entry.is_dir():
+                # copytree creates dest_item before copying anything, so an existing one fails fast
+                try:
+                    shutil.copytree(entry.path, dest_item)
+                except FileExistsError:
+                    safe_rmtree(dest_item)
+                    shutil.copytree(entry.path, dest_item)
+            else:
+                shutil.copy2(entry.path, dest_item)
 
 
 def copy_script_file(source_root: Path, script_rel_path: str, dest_root: Path) -> Path:
@@ -303,12 +322,16 @@ def copy_script_file(source_root: Path, script_rel_path: str, dest_root: Path) -
         OSError: If copy operation fails
     """
     source_script = source_root / script_rel_path
-    if not source_script.exists():
-        raise FileNotFoundError(f"Script not found: {source_script}")
+    # One stat for the common case; exists() only runs to pick the error
     if not source_script.is_file():
-        raise IsADirectoryError(f"Script path is not a file: {source_script}")
+        if source_script.exists():
+            raise IsADirectoryError(f"Script path is not a file: {source_script}")
+        raise FileNotFoundError(f"Script not found: {source_script}")
 
     dest_script = dest_root / script_rel_path
+    if source_script.resolve() == dest_script.resolve():
+        # Installed in place from the managed copy; nothing to copy
+        return dest_script
     ensure_dir(dest_script.parent)
     shutil.copy2(source_script, dest_script)
     return dest_script
@@ -68,6 +68,11 @@ def test_cli_doctor_detects_and_repairs_state_issues(tmp_path: Path) -> None:
 
     assert repair_result.exit_code == 0, repair_result.output
     assert "Repair complete" in repair_result.output
+    assert (
+        repair_result.output.index("Found")
+        < repair_result.output.index("Repairing state...")
+        < repair_result.output.index("Repair complete")
+    )
     assert "Removed 1 broken symlink" in repair_result.output
     assert "Removed 1 missing script" in repair_result.output
 
@@ -77,6 +82,65 @@ def test_cli_doctor_detects_and_repairs_state_issues(tmp_path: Path) -> None:
     assert not broken_symlink.exists()
 
 
+def test_cli_doctor_repair_on_healthy_state_prints_no_repair_line(tmp_path: Path) -> None:
+    """--repair should only announce a repair when validation found issues."""
+    runner = CliRunner()
+    config_path = tmp_path / "config.toml"
+    _write_config(config_path, tmp_path / "repos", tmp_path / "bin", tmp_path / "state.json")
+
+    result = runner.invoke(cli, ["--config", str(config_path), "doctor", "--repair"])
+
+    assert result.exit_code == 0, result.output
+    assert "No issues found" in result.output
+    assert "Repairing state" not in result.output
+
+
+def test_cli_doctor_prints_sections_before_script_status_checks(tmp_path: Path, monkeypatch) -> None:
+    """Doctor should print earlier sections before the per-script status checks run."""
+    from uv_script_manager import cli as cli_module
+
+    runner = CliRunner()
+    repo_dir = tmp_path / "repos"
+    install_dir = tmp_path / "bin"
+    state_file = tmp_path / "state.json"
+    config_path = tmp_path / "config.toml"
+    _write_config(config_path, repo_dir, install_dir, state_file)
+
+    script_repo = repo_dir / "local"
+    script_repo.mkdir(parents=True)
+    (script_repo / "tool.py").write_text("print('ok')\n", encoding="utf-8")
+    StateManager(state_file).add_script(
+        ScriptInfo(
+            name="tool.py",
+            source_type=SourceType.LOCAL,
+            installed_at=datetime.now(),
+            repo_path=script_repo,
+            source_path=tmp_path,
+        )
+    )
+
+    events: list[str] = []
+    real_print = cli_module.console.print
+
+    def record_print(*args, **kwargs) -> None:
+        events.append("print")
+        real_print(*args, **kwargs)
+
+    def record_status(*args, **kwargs) -> str:
+        events.append("status")
+        return "local"
+
+    monkeypatch.setattr(cli_module.console, "print", record_print)
+    monkeypatch.setattr("uv_script_manager.display.get_script_status_key", record_status)
+
+    result = runner.invoke(cli, ["--config", str(config_path), "doctor"])
+
+    assert result.exit_code == 0, result.output
+    assert "System Dependencies" in result.output
+    assert events.index("status") > events.index("print")
+    assert events[-1] == "print"
+
+
 def test_cli_browse_uses_github_api_when_available(tmp_path: Path, monkeypatch) -> None:
     """browse should use GitHub API listing when gh is available."""
     runner = CliRunner()
@@ -87,7 +151,7 @@ def test_cli_browse_uses_github_api_when_available(tmp_path: Path, monkeypatch)
     config_path = tmp_path / "config.toml"
     _write_config(config_path, repo_dir, install_dir, state_file)
 
-    monkeypatch.setattr("uv_script_manager.cli.verify_uv_available", lambda: True)
+    monkeypatch.setattr("uv_script_manager.script_installer.verify_uv_available", lambda: True)
 
     real_which = shutil.which
 
@@ -129,6 +193,29 @@ def test_cli_browse_uses_github_api_when_available(tmp_path: Path, monkeypatch)
     assert "2 candidate script(s) found" in result.output
 
 
+def test_cli_browse_lists_subdirectories_after_their_parent(tmp_path: Path, monkeypatch) -> None:
+    """browse should order directories by path segments, keeping subdirectories under their parent."""
+    runner = CliRunner()
+    config_path = tmp_path / "config.toml"
+    _write_config(config_path, tmp_path / "repos", tmp_path / "bin", tmp_path / "state.json")
+
+    real_which = shutil.which
+    monkeypatch.setattr(shutil, "which", lambda cmd: "/usr/bin/gh" if cmd == "gh" else real_which(cmd))
+    monkeypatch.setattr(
+        subprocess,
+        "run",
+        lambda cmd, **kwargs: subprocess.CompletedProcess(
+            args=cmd, returncode=0, stdout="a-b/y.py\na/x.py\na/sub/z.py\ntop.py\n", stderr=""
+        ),
+    )
+
+    result = runner.invoke(cli, ["--config", str(config_path), "browse", "https://github.com/acme/repo#main"])
+
+    assert result.exit_code == 0, result.output
+    nodes = [line.split("── ", 1)[1].strip() for line in result.output.splitlines() if "── " in line]
+    assert nodes == ["top.py", "a", "x.py", "a/sub", "z.py", "a-b", "y.py"]
+
+
 def test_cli_browse_clone_fallback_respects_all_flag(tmp_path: Path, monkeypatch) -> None:
     """browse fallback should filter defaults and include extra files with --all."""
     import tempfile
@@ -141,7 +228,7 @@ def test_cli_browse_clone_fallback_respects_all_flag(tmp_path: Path, monkeypatch
     config_path = tmp_path / "config.toml"
     _write_config(config_path, repo_dir, install_dir, state_file)
 
-    monkeypatch.setattr("uv_script_manager.cli.verify_uv_available", lambda: True)
+    monkeypatch.setattr("uv_script_manager.script_installer.verify_uv_available", lambda: True)
     monkeypatch.setattr(tempfile, "gettempdir", lambda: str(tmp_path))
 
     real_which = shutil.which
@@ -190,6 +277,42 @@ def test_cli_browse_clone_fallback_respects_all_flag(tmp_path: Path, monkeypatch
     assert "3 Python file(s) found" in all_result.output
 
 
+def test_cli_browse_skips_github_api_for_non_github_hosts(tmp_path: Path, monkeypatch) -> None:
+    """browse should only use the GitHub API for github.com repository URLs."""
+    import tempfile
+
+    runner = CliRunner()
+
+    repo_dir = tmp_path / "repos"
+    install_dir = tmp_path / "bin"
+    state_file = tmp_path / "state.json"
+    config_path = tmp_path / "config.toml"
+    _write_config(config_path, repo_dir, install_dir, state_file)
+
+    monkeypatch.setattr("uv_script_manager.script_installer.verify_uv_available", lambda: True)
+    monkeypatch.setattr(tempfile, "gettempdir", lambda: str(tmp_path))
+
+    def fail_subprocess_run(cmd, **kwargs):
+        raise AssertionError("GitHub API should not be queried for non-GitHub hosts")
+
+    monkeypatch.setattr(subprocess, "run", fail_subprocess_run)
+
+    def fake_clone_or_update(url, ref, repo_path, depth=1, ref_type=None):
+        repo_path.mkdir(parents=True, exist_ok=True)
+        (repo_path / "app.py").write_text("print('app')\n", encoding="utf-8")
+
+    monkeypatch.setattr("uv_script_manager.git_manager.clone_or_update", fake_clone_or_update)
+
+    result = runner.invoke(
+        cli,
+        ["--config", str(config_path), "browse", "https://notgithub.com/acme/repo"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Fetching file list from GitHub API" not in result.output
+    assert "1 candidate script(s) found" in result.output
+
+
 def test_cli_browse_prefers_better_install_hint_over_docs_file(tmp_path: Path, monkeypatch) -> None:
     """browse install hint should prefer likely entrypoints over documentation scripts."""
     import tempfile
@@ -202,7 +325,7 @@ def test_cli_browse_prefers_better_install_hint_over_docs_file(tmp_path: Path, m
     config_path = tmp_path / "config.toml"
     _write_config(config_path, repo_dir, install_dir, state_file)
 
-    monkeypatch.setattr("uv_script_manager.cli.verify_uv_available", lambda: True)
+    monkeypatch.setattr("uv_script_manager.script_installer.verify_uv_available", lambda: True)
     monkeypatch.setattr(tempfile, "gettempdir", lambda: str(tmp_path))
 
     real_which = shutil.which
@@ -245,7 +368,7 @@ def test_cli_browse_error_branches_and_doctor_uv_missing(tmp_path: Path, monkeyp
     config_path = tmp_path / "config.toml"
     _write_config(config_path, repo_dir, install_dir, state_file)
 
-    monkeypatch.setattr("uv_script_manager.cli.verify_uv_available", lambda: True)
+    monkeypatch.setattr("uv_script_manager.script_installer.verify_uv_available", lambda: True)
     monkeypatch.setattr(tempfile, "gettempdir", lambda: str(tmp_path))
 
     real_which = shutil.which
@@ -297,15 +420,10 @@ def test_cli_browse_error_branches_and_doctor_uv_missing(tmp_path: Path, monkeyp
     assert browse_error.exit_code != 0
     assert "Error:" in browse_error.output
 
-    verify_calls = {"count": 0}
-
-    def verify_uv_sequence() -> bool:
-        verify_calls["count"] += 1
-        if verify_calls["count"] == 1:
-            return True
+    def verify_uv_missing() -> bool:
         raise ScriptInstallerError("uv missing")
 
-    monkeypatch.setattr("uv_script_manager.cli.verify_uv_available", verify_uv_sequence)
+    monkeypatch.setattr("uv_script_manager.script_installer.verify_uv_available", verify_uv_missing)
     doctor_result = runner.invoke(cli, ["--config", str(config_path), "doctor"])
     assert doctor_result.exit_code == 0, doctor_result.output
     assert "uv (Python package manager):" in doctor_result.output
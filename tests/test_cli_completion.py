@@ -8,12 +8,8 @@ import pytest
 from click.testing import CliRunner
 
 from tests.cli_helpers import REQUIRES_UV, REQUIRES_UV_HELPER, _write_config
-from uv_script_manager.cli import (
-    _parse_script_selection,
-    _prompt_for_script_selection,
-    cli,
-    complete_script_names,
-)
+from uv_script_manager.cli import CliContext, cli, complete_script_names
+from uv_script_manager.cli_commands.install import _parse_script_selection, _prompt_for_script_selection
 from uv_script_manager.constants import SourceType
 from uv_script_manager.state import ScriptInfo, StateManager
 
@@ -42,7 +38,7 @@ def test_complete_script_names_includes_alias_from_context(tmp_path: Path, monke
     )
 
     ctx = click.Context(cli)
-    ctx.obj = {"config": config}
+    ctx.obj = CliContext(config)
 
     alias_matches = complete_script_names(ctx, param=click.Option(["--x"]), incomplete="sh")
     name_matches = complete_script_names(ctx, param=click.Option(["--x"]), incomplete="to")
@@ -60,7 +56,7 @@ def test_complete_script_names_returns_empty_on_internal_error(monkeypatch) -> N
     def raise_error() -> Path:
         raise RuntimeError("boom")
 
-    monkeypatch.setattr("uv_script_manager.cli.get_config_path", raise_error)
+    monkeypatch.setattr("uv_script_manager.config.get_config_path", raise_error)
 
     assert complete_script_names(ctx, param=click.Option(["--x"]), incomplete="x") == []
 
@@ -85,11 +81,13 @@ def test_complete_script_names_uses_parent_context_config(tmp_path: Path, monkey
         )
     )
 
-    monkeypatch.setattr("uv_script_manager.cli.get_config_path", lambda: tmp_path / "missing.toml")
+    monkeypatch.setattr("uv_script_manager.config.get_config_path", lambda: tmp_path / "missing.toml")
 
     root_ctx = click.Context(cli)
     root_ctx.params = {"config": config_path}
-    show_ctx = click.Context(cli.commands["show"], parent=root_ctx)
+    show_command = cli.get_command(root_ctx, "show")
+    assert show_command is not None
+    show_ctx = click.Context(show_command, parent=root_ctx)
     show_ctx.obj = None
 
     matches = complete_script_names(show_ctx, param=click.Option(["--x"]), incomplete="parent")
@@ -117,7 +115,7 @@ def test_complete_script_names_uses_comp_words_config(tmp_path: Path, monkeypatc
         )
     )
 
-    monkeypatch.setattr("uv_script_manager.cli.get_config_path", lambda: tmp_path / "missing.toml")
+    monkeypatch.setattr("uv_script_manager.config.get_config_path", lambda: tmp_path / "missing.toml")
     monkeypatch.setenv("COMP_WORDS", f"uv-script-manager --config {config_path} show ")
 
     ctx = click.Context(cli)
@@ -50,6 +50,11 @@ def test_cli_import_dry_run_uses_ref_type_for_rendering(tmp_path: Path) -> None:
                         "ref": "deadbeef",
                         "ref_type": "commit",
                     },
+                    {
+                        "name": "[bold]tool.py",
+                        "source_type": "local",
+                        "source": "/tmp/[red]scripts",
+                    },
                 ],
             }
         ),
@@ -68,6 +73,8 @@ def test_cli_import_dry_run_uses_ref_type_for_rendering(tmp_path: Path) -> None:
     assert "@v1.2.3" in result.output
     assert "commit-tool.py" in result.output
     assert "@deadbeef" in result.output
+    # Import file contents are printed verbatim, not interpreted as Rich markup
+    assert "[bold]tool.py from /tmp/[red]scripts" in result.output
 
 
 @REQUIRES_UV
@@ -118,7 +125,7 @@ def test_cli_export_no_scripts_and_import_input_validation(tmp_path: Path, monke
     config_path = tmp_path / "config.toml"
     _write_config(config_path, repo_dir, install_dir, state_file)
 
-    monkeypatch.setattr("uv_script_manager.cli.verify_uv_available", lambda: True)
+    monkeypatch.setattr("uv_script_manager.script_installer.verify_uv_available", lambda: True)
 
     export_result = runner.invoke(cli, ["--config", str(config_path), "export"])
     assert export_result.exit_code == 0, export_result.output
@@ -133,6 +140,15 @@ def test_cli_export_no_scripts_and_import_input_validation(tmp_path: Path, monke
     assert invalid_json_result.exit_code != 0
     assert "Invalid JSON file" in invalid_json_result.output
 
+    invalid_utf8 = tmp_path / "invalid-utf8.json"
+    invalid_utf8.write_bytes(b'{"scripts": "\xff"}')
+    invalid_utf8_result = runner.invoke(
+        cli,
+        ["--config", str(config_path), "import", str(invalid_utf8)],
+    )
+    assert invalid_utf8_result.exit_code == 1
+    assert "Invalid JSON file" in invalid_utf8_result.output
+
     missing_key = tmp_path / "missing-key.json"
     missing_key.write_text(json.dumps({"version": 1}), encoding="utf-8")
     missing_key_result = runner.invoke(
@@ -151,6 +167,15 @@ def test_cli_export_no_scripts_and_import_input_validation(tmp_path: Path, monke
     assert empty_scripts_result.exit_code == 0, empty_scripts_result.output
     assert "No scripts to import." in empty_scripts_result.output
 
+    bom_scripts = tmp_path / "bom-scripts.json"
+    bom_scripts.write_text(json.dumps({"version": 1, "scripts": []}), encoding="utf-8-sig")
+    bom_scripts_result = runner.invoke(
+        cli,
+        ["--config", str(config_path), "import", str(bom_scripts)],
+    )
+    assert bom_scripts_result.exit_code == 0, bom_scripts_result.output
+    assert "No scripts to import." in bom_scripts_result.output
+
 
 def test_cli_import_handles_missing_entries_and_install_errors(tmp_path: Path, monkeypatch) -> None:
     """import should keep going when entries are incomplete or install fails."""
@@ -161,12 +186,12 @@ def test_cli_import_handles_missing_entries_and_install_errors(tmp_path: Path, m
     config_path = tmp_path / "config.toml"
     _write_config(config_path, repo_dir, install_dir, state_file)
 
-    monkeypatch.setattr("uv_script_manager.cli.verify_uv_available", lambda: True)
+    monkeypatch.setattr("uv_script_manager.script_installer.verify_uv_available", lambda: True)
 
     def fail_install(self, source, scripts, request):
         raise ValueError("install failed")
 
-    monkeypatch.setattr("uv_script_manager.cli.InstallHandler.install", fail_install)
+    monkeypatch.setattr("uv_script_manager.commands.InstallHandler.install", fail_install)
 
     import_file = tmp_path / "import.json"
     import_file.write_text(
@@ -338,3 +363,33 @@ def test_cli_export_preserves_git_ref_metadata_and_import_dry_run_uses_it(tmp_pa
     assert "#main" in dry_run_result.output
     assert "@v1.2.3" in dry_run_result.output
     assert "@deadbeef" in dry_run_result.output
+
+
+def test_cli_export_stdout_is_valid_json(tmp_path: Path) -> None:
+    """export without -o should write parseable JSON to stdout, even for long values."""
+    runner = CliRunner()
+    repo_dir = tmp_path / "repos"
+    state_file = tmp_path / "state.json"
+    config_path = tmp_path / "config.toml"
+    _write_config(config_path, repo_dir, tmp_path / "bin", state_file)
+
+    long_url = "https://github.com/acme/" + "very-long-repository-name-" * 6
+    StateManager(state_file).add_script(
+        ScriptInfo(
+            name="tool.py",
+            source_type=SourceType.GIT,
+            source_url=long_url,
+            ref="main",
+            ref_type="branch",
+            installed_at=datetime.now(),
+            repo_path=repo_dir / "acme-repo",
+            dependencies=["requests[socks]"],
+        )
+    )
+
+    result = runner.invoke(cli, ["--config", str(config_path), "export"])
+
+    assert result.exit_code == 0, result.output
+    exported = json.loads(result.output)
+    assert exported["scripts"][0]["source"] == long_url
+    assert exported["scripts"][0]["dependencies"] == ["requests[socks]"]
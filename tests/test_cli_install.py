@@ -21,7 +21,7 @@ def test_cli_local_install_update_and_remove(tmp_path: Path, monkeypatch) -> Non
     _write_config(config_path, repo_dir, install_dir, state_file)
 
     monkeypatch.setenv("UV_SCRIPT_MANAGER_CONFIG", str(config_path))
-    monkeypatch.setattr("uv_script_manager.cli.verify_uv_available", lambda: True)
+    monkeypatch.setattr("uv_script_manager.script_installer.verify_uv_available", lambda: True)
 
     def _fail_if_git_called() -> None:
         raise AssertionError("git verification should not run")
@@ -93,7 +93,7 @@ def test_cli_install_with_add_source_package(tmp_path: Path, monkeypatch) -> Non
     _write_config(config_path, repo_dir, install_dir, state_file)
 
     monkeypatch.setenv("UV_SCRIPT_MANAGER_CONFIG", str(config_path))
-    monkeypatch.setattr("uv_script_manager.cli.verify_uv_available", lambda: True)
+    monkeypatch.setattr("uv_script_manager.script_installer.verify_uv_available", lambda: True)
     monkeypatch.setattr("uv_script_manager.commands.install.verify_git_available", lambda: None)
 
     dependencies_seen: dict[str, list[str]] = {}
@@ -160,11 +160,11 @@ def test_cli_install_prompts_for_script_when_interactive(tmp_path: Path, monkeyp
     config_path = tmp_path / "config.toml"
     _write_config(config_path, repo_dir, install_dir, state_file)
 
-    monkeypatch.setattr("uv_script_manager.cli.verify_uv_available", lambda: True)
+    monkeypatch.setattr("uv_script_manager.script_installer.verify_uv_available", lambda: True)
 
-    monkeypatch.setattr("uv_script_manager.cli._is_interactive_terminal", lambda: True)
+    monkeypatch.setattr("uv_script_manager.cli_commands.install._is_interactive_terminal", lambda: True)
     monkeypatch.setattr(
-        "uv_script_manager.cli._discover_install_script_candidates",
+        "uv_script_manager.cli_commands.install._discover_install_script_candidates",
         lambda source, clone_depth: ["a.py", "pkg/b.py"],
     )
 
@@ -174,7 +174,7 @@ def test_cli_install_prompts_for_script_when_interactive(tmp_path: Path, monkeyp
         captured["scripts"] = scripts
         return [(scripts[0], True, install_dir / scripts[0])]
 
-    monkeypatch.setattr("uv_script_manager.cli.InstallHandler.install", fake_install)
+    monkeypatch.setattr("uv_script_manager.commands.InstallHandler.install", fake_install)
 
     result = runner.invoke(
         cli,
@@ -194,7 +194,7 @@ def test_cli_install_invalid_source(tmp_path: Path, monkeypatch) -> None:
     _write_config(config_path, tmp_path / "repos", tmp_path / "bin", tmp_path / "state.json")
 
     monkeypatch.setenv("UV_SCRIPT_MANAGER_CONFIG", str(config_path))
-    monkeypatch.setattr("uv_script_manager.cli.verify_uv_available", lambda: True)
+    monkeypatch.setattr("uv_script_manager.script_installer.verify_uv_available", lambda: True)
 
     result = runner.invoke(cli, ["install", "not-a-url-or-path", "--script", "tool.py"])
 
@@ -213,7 +213,7 @@ def test_cli_install_script_not_found(tmp_path: Path, monkeypatch) -> None:
     _write_config(config_path, repo_dir, install_dir, state_file)
 
     monkeypatch.setenv("UV_SCRIPT_MANAGER_CONFIG", str(config_path))
-    monkeypatch.setattr("uv_script_manager.cli.verify_uv_available", lambda: True)
+    monkeypatch.setattr("uv_script_manager.script_installer.verify_uv_available", lambda: True)
     monkeypatch.setattr("uv_script_manager.commands.install.verify_git_available", lambda: None)
 
     source_dir = tmp_path / "source"
@@ -235,7 +235,7 @@ def test_cli_install_add_source_without_copy_parent(tmp_path: Path, monkeypatch)
     _write_config(config_path, tmp_path / "repos", tmp_path / "bin", tmp_path / "state.json")
 
     monkeypatch.setenv("UV_SCRIPT_MANAGER_CONFIG", str(config_path))
-    monkeypatch.setattr("uv_script_manager.cli.verify_uv_available", lambda: True)
+    monkeypatch.setattr("uv_script_manager.script_installer.verify_uv_available", lambda: True)
 
     source_dir = tmp_path / "source"
     source_dir.mkdir()
@@ -269,10 +269,10 @@ def test_cli_install_interactive_discovery_failure_exits(tmp_path: Path, monkeyp
     source_dir = tmp_path / "source"
     source_dir.mkdir()
 
-    monkeypatch.setattr("uv_script_manager.cli.verify_uv_available", lambda: True)
-    monkeypatch.setattr("uv_script_manager.cli._is_interactive_terminal", lambda: True)
+    monkeypatch.setattr("uv_script_manager.script_installer.verify_uv_available", lambda: True)
+    monkeypatch.setattr("uv_script_manager.cli_commands.install._is_interactive_terminal", lambda: True)
     monkeypatch.setattr(
-        "uv_script_manager.cli._discover_install_script_candidates",
+        "uv_script_manager.cli_commands.install._discover_install_script_candidates",
         lambda source, clone_depth: (_ for _ in ()).throw(ValueError("clone failed")),
     )
 
@@ -297,9 +297,11 @@ def test_cli_install_interactive_no_candidates_exits(tmp_path: Path, monkeypatch
     source_dir = tmp_path / "source"
     source_dir.mkdir()
 
-    monkeypatch.setattr("uv_script_manager.cli.verify_uv_available", lambda: True)
-    monkeypatch.setattr("uv_script_manager.cli._is_interactive_terminal", lambda: True)
-    monkeypatch.setattr("uv_script_manager.cli._discover_install_script_candidates", lambda *_args: [])
+    monkeypatch.setattr("uv_script_manager.script_installer.verify_uv_available", lambda: True)
+    monkeypatch.setattr("uv_script_manager.cli_commands.install._is_interactive_terminal", lambda: True)
+    monkeypatch.setattr(
+        "uv_script_manager.cli_commands.install._discover_install_script_candidates", lambda *_args: []
+    )
 
     result = runner.invoke(
         cli,
@@ -320,7 +322,7 @@ def test_cli_install_rejects_alias_with_multiple_scripts(tmp_path: Path, monkeyp
     config_path = tmp_path / "config.toml"
     _write_config(config_path, repo_dir, install_dir, state_file)
 
-    monkeypatch.setattr("uv_script_manager.cli.verify_uv_available", lambda: True)
+    monkeypatch.setattr("uv_script_manager.script_installer.verify_uv_available", lambda: True)
 
     result = runner.invoke(
         cli,
@@ -351,9 +353,9 @@ def test_cli_install_prints_multi_script_next_hint(tmp_path: Path, monkeypatch)
     config_path = tmp_path / "config.toml"
     _write_config(config_path, repo_dir, install_dir, state_file)
 
-    monkeypatch.setattr("uv_script_manager.cli.verify_uv_available", lambda: True)
+    monkeypatch.setattr("uv_script_manager.script_installer.verify_uv_available", lambda: True)
     monkeypatch.setattr(
-        "uv_script_manager.cli.InstallHandler.install",
+        "uv_script_manager.commands.InstallHandler.install",
         lambda self, source, scripts, request: [
             ("a.py", True, install_dir / "a.py"),
             ("b.py", True, install_dir / "b.py"),
@@ -390,9 +392,9 @@ def test_cli_install_reports_no_symlink_location_consistently(tmp_path: Path, mo
     source_dir = tmp_path / "source"
     source_dir.mkdir()
 
-    monkeypatch.setattr("uv_script_manager.cli.verify_uv_available", lambda: True)
+    monkeypatch.setattr("uv_script_manager.script_installer.verify_uv_available", lambda: True)
     monkeypatch.setattr(
-        "uv_script_manager.cli.InstallHandler.install",
+        "uv_script_manager.commands.InstallHandler.install",
         lambda self, source, scripts, request: [("tool.py", True, None)],
     )
 
@@ -0,0 +1,158 @@
+"""Lazy subcommand loading tests."""
+
+import subprocess
+import sys
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from tests.cli_helpers import _write_config
+from uv_script_manager.cli import LAZY_SUBCOMMAND_HELP, LAZY_SUBCOMMANDS, LazyGroup, cli
+
+
+def test_cli_lists_and_resolves_lazy_subcommands() -> None:
+    """Every registered subcommand should be listed and resolve to a Click command."""
+    ctx = click.Context(cli)
+
+    assert cli.list_commands(ctx) == sorted(LAZY_SUBCOMMANDS)
+    for name in LAZY_SUBCOMMANDS:
+        command = cli.get_command(ctx, name)
+        assert isinstance(command, click.Command)
+
+    assert cli.get_command(ctx, "missing") is None
+
+
+def test_lazy_subcommand_that_is_not_a_command_raises_type_error() -> None:
+    """A lazy entry resolving to something other than a Click command is a type error."""
+    group = LazyGroup(lazy_subcommands={"bad": "uv_script_manager.constants:JSON_OUTPUT_INDENT"})
+
+    with pytest.raises(TypeError, match="did not resolve to a Click command"):
+        group.get_command(click.Context(group), "bad")
+
+
+def test_lazy_subcommand_help_matches_command_docstrings() -> None:
+    """Static help entries should match each visible command's own short help."""
+    ctx = click.Context(cli)
+
+    for name in LAZY_SUBCOMMANDS:
+        command = cli.get_command(ctx, name)
+        assert command is not None
+        if command.hidden:
+            assert name not in LAZY_SUBCOMMAND_HELP
+        else:
+            assert LAZY_SUBCOMMAND_HELP[name] == command.get_short_help_str(limit=1000)
+
+
+HELP_CODE = (
+    "from click.testing import CliRunner\n"
+    "from uv_script_manager.cli import cli\n"
+    "result = CliRunner().invoke(cli, ['--help'])\n"
+    "assert result.exit_code == 0, result.output\n"
+    "assert 'update  ' in result.output and 'update-all' not in result.output, result.output\n"
+)
+
+
+def _loaded_modules(code: str, names: tuple[str, ...]) -> list[str]:
+    """
+    Run code in a fresh interpreter and report which of the given modules it imported.
+
+    Args:
+        code: Python source to run
+        names: Module names to look for; a name ending in "." matches any submodule of that package
+
+    Returns:
+        Loaded modules matching names, in import order
+    """
+    script = (
+        f"{code}\n"
+        "import sys\n"
+        f"names = {names!r}\n"
+        "print(','.join(m for m in sys.modules"
+        " if any(m == n or (n.endswith('.') and m.startswith(n)) for n in names)))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    return [name for name in result.stdout.strip().split(",") if name]
+
+
+@pytest.mark.parametrize(
+    ("code", "names"),
+    [
+        pytest.param(
+            "import uv_script_manager.cli",
+            (
+                "uv_script_manager.cli_commands.",
+                "uv_script_manager.config",
+                "uv_script_manager.script_installer",
+                "pydantic",
+                "rich",
+            ),
+            id="import-cli",
+        ),
+        pytest.param(
+            HELP_CODE,
+            (
+                "uv_script_manager.cli_commands.",
+                "uv_script_manager.state",
+                "uv_script_manager.display",
+                "uv_script_manager.script_installer",
+                "pydantic",
+            ),
+            id="top-level-help",
+        ),
+        pytest.param(
+            "from uv_script_manager.commands import RemoveHandler",
+            ("uv_script_manager.commands.install", "uv_script_manager.commands.update"),
+            id="single-handler",
+        ),
+    ],
+)
+def test_modules_are_imported_on_demand(code: str, names: tuple[str, ...]) -> None:
+    """Importing the CLI, rendering --help, or importing one handler should not load unrelated modules."""
+    assert _loaded_modules(code, names) == []
+
+
+def test_cli_list_does_not_load_installer_dependencies(tmp_path) -> None:
+    """Read-only commands should not import installer-only modules and libraries."""
+    config_path = tmp_path / "config.toml"
+    _write_config(config_path, tmp_path / "repos", tmp_path / "bin", tmp_path / "state.json")
+    code = (
+        "from click.testing import CliRunner\n"
+        "from uv_script_manager.cli import cli\n"
+        f"result = CliRunner().invoke(cli, ['--config', {str(config_path)!r}, 'list'])\n"
+        "assert result.exit_code == 0, result.output\n"
+    )
+
+    loaded = _loaded_modules(
+        code, ("uv_script_manager.script_installer", "giturlparse", "pathvalidate", "rich.progress")
+    )
+
+    assert loaded == []
+
+
+def test_entry_point_version_matches_click_without_importing_it() -> None:
+    """The console entry point should answer --version like Click does, without importing Click."""
+    code = (
+        "import sys\n"
+        "sys.argv = ['uvsm', '--version']\n"
+        "from uv_script_manager.__main__ import main\n"
+        "main()\n"
+        "print('click' in sys.modules)\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    click_result = CliRunner().invoke(cli, ["--version"], prog_name="uvsm")
+
+    assert click_result.exit_code == 0
+    assert result.stdout == f"{click_result.output}False\n"
+
+
+def test_entry_point_delegates_other_arguments_to_click(monkeypatch) -> None:
+    """Anything other than a bare --version should run the Click group."""
+    from uv_script_manager.__main__ import main
+
+    monkeypatch.setattr(sys, "argv", ["uvsm", "--help"])
+
+    with pytest.raises(SystemExit) as exc_info:
+        main()
+
+    assert exc_info.value.code == 0
@@ -4,12 +4,15 @@ import json
 from datetime import datetime
 from pathlib import Path
 
+import pytest
 from click.testing import CliRunner
 from rich.console import Console
 
 from tests.cli_helpers import REQUIRES_GIT, REQUIRES_UV, _run_git, _write_config
 from uv_script_manager.cli import cli
-from uv_script_manager.constants import GIT_SHORT_HASH_LENGTH, SourceType
+from uv_script_manager.cli_commands.list_scripts import _echo_scripts_json
+from uv_script_manager.constants import GIT_SHORT_HASH_LENGTH, JSON_OUTPUT_INDENT, SourceType
+from uv_script_manager.script_installer import ScriptInstallerError
 from uv_script_manager.state import ScriptInfo, StateManager
 
 
@@ -22,7 +25,7 @@ def test_cli_list_tree_verbose_groups_sources_and_aliases(tmp_path: Path, monkey
     config_path = tmp_path / "config.toml"
     _write_config(config_path, repo_dir, install_dir, state_file)
 
-    monkeypatch.setattr("uv_script_manager.cli.verify_uv_available", lambda: True)
+    monkeypatch.setattr("uv_script_manager.script_installer.verify_uv_available", lambda: True)
     monkeypatch.setattr(
         "uv_script_manager.local_changes.get_local_change_state",
         lambda repo, name: "blocking" if name == "git_tool.py" else "managed",
@@ -77,7 +80,7 @@ def test_cli_list_full_disables_truncation(tmp_path: Path, monkeypatch) -> None:
     config_path = tmp_path / "config.toml"
     _write_config(config_path, repo_dir, install_dir, state_file)
 
-    monkeypatch.setattr("uv_script_manager.cli.verify_uv_available", lambda: True)
+    monkeypatch.setattr("uv_script_manager.script_installer.verify_uv_available", lambda: True)
 
     state_manager = StateManager(state_file)
     state_manager.add_script(
@@ -118,8 +121,8 @@ def test_cli_list_full_changes_wide_verbose_output_for_long_values(tmp_path: Pat
     config_path = tmp_path / "config.toml"
     _write_config(config_path, repo_dir, install_dir, state_file)
 
-    monkeypatch.setattr("uv_script_manager.cli.verify_uv_available", lambda: True)
-    monkeypatch.setattr("uv_script_manager.cli.console", Console(width=240))
+    monkeypatch.setattr("uv_script_manager.script_installer.verify_uv_available", lambda: True)
+    monkeypatch.setattr("uv_script_manager.cli_commands.list_scripts.console", Console(width=240))
 
     state_manager = StateManager(state_file)
     state_manager.add_script(
@@ -158,7 +161,7 @@ def test_cli_list_verbose_keeps_status_and_ref_readable_at_medium_width(tmp_path
     config_path = tmp_path / "config.toml"
     _write_config(config_path, repo_dir, install_dir, state_file)
 
-    monkeypatch.setattr("uv_script_manager.cli.verify_uv_available", lambda: True)
+    monkeypatch.setattr("uv_script_manager.script_installer.verify_uv_available", lambda: True)
     monkeypatch.setattr(
         "uv_script_manager.local_changes.get_local_change_state",
         lambda repo, name: "managed",
@@ -209,7 +212,7 @@ def test_cli_list_filters_by_source_ref_and_status(tmp_path: Path, monkeypatch)
     config_path = tmp_path / "config.toml"
     _write_config(config_path, repo_dir, install_dir, state_file)
 
-    monkeypatch.setattr("uv_script_manager.cli.verify_uv_available", lambda: True)
+    monkeypatch.setattr("uv_script_manager.script_installer.verify_uv_available", lambda: True)
 
     state_manager = StateManager(state_file)
     state_manager.add_script(
@@ -281,7 +284,7 @@ def test_cli_list_prints_needs_attention_hint(tmp_path: Path, monkeypatch) -> No
     config_path = tmp_path / "config.toml"
     _write_config(config_path, repo_dir, install_dir, state_file)
 
-    monkeypatch.setattr("uv_script_manager.cli.verify_uv_available", lambda: True)
+    monkeypatch.setattr("uv_script_manager.script_installer.verify_uv_available", lambda: True)
     monkeypatch.setattr(
         "uv_script_manager.local_changes.get_local_change_state",
         lambda repo, name: "blocking",
@@ -321,7 +324,7 @@ def test_cli_list_sorts_by_updated_descending(tmp_path: Path, monkeypatch) -> No
     config_path = tmp_path / "config.toml"
     _write_config(config_path, repo_dir, install_dir, state_file)
 
-    monkeypatch.setattr("uv_script_manager.cli.verify_uv_available", lambda: True)
+    monkeypatch.setattr("uv_script_manager.script_installer.verify_uv_available", lambda: True)
 
     state_manager = StateManager(state_file)
     state_manager.add_script(
@@ -362,7 +365,7 @@ def test_cli_list_shows_message_when_filters_match_nothing(tmp_path: Path, monke
     config_path = tmp_path / "config.toml"
     _write_config(config_path, repo_dir, install_dir, state_file)
 
-    monkeypatch.setattr("uv_script_manager.cli.verify_uv_available", lambda: True)
+    monkeypatch.setattr("uv_script_manager.script_installer.verify_uv_available", lambda: True)
 
     state_manager = StateManager(state_file)
     state_manager.add_script(
@@ -394,7 +397,7 @@ def test_cli_list_json_outputs_parseable_payload(tmp_path: Path, monkeypatch) ->
     config_path = tmp_path / "config.toml"
     _write_config(config_path, repo_dir, install_dir, state_file)
 
-    monkeypatch.setattr("uv_script_manager.cli.verify_uv_available", lambda: True)
+    monkeypatch.setattr("uv_script_manager.script_installer.verify_uv_available", lambda: True)
 
     state_manager = StateManager(state_file)
     state_manager.add_script(
@@ -419,6 +422,22 @@ def test_cli_list_json_outputs_parseable_payload(tmp_path: Path, monkeypatch) ->
     assert payload["scripts"][0]["source_type"] == "local"
 
 
+@pytest.mark.parametrize(
+    "records",
+    [
+        [],
+        [{"name": "a.py", "dependencies": []}],
+        [{"name": "a.py", "dependencies": ["click"]}, {"name": "b.py", "alias": None, "nested": {"k": 1}}],
+    ],
+)
+def test_cli_list_json_streams_same_document_as_json_dumps(records, capsys) -> None:
+    """Record-by-record JSON output should match a single json.dumps of the payload."""
+    _echo_scripts_json(iter(records))
+
+    expected = json.dumps({"scripts": records}, indent=JSON_OUTPUT_INDENT) + "\n"
+    assert capsys.readouterr().out == expected
+
+
 def test_cli_list_json_rejects_tree_mode(tmp_path: Path, monkeypatch) -> None:
     """list --json should reject --tree mode."""
     runner = CliRunner()
@@ -429,7 +448,7 @@ def test_cli_list_json_rejects_tree_mode(tmp_path: Path, monkeypatch) -> None:
     config_path = tmp_path / "config.toml"
     _write_config(config_path, repo_dir, install_dir, state_file)
 
-    monkeypatch.setattr("uv_script_manager.cli.verify_uv_available", lambda: True)
+    monkeypatch.setattr("uv_script_manager.script_installer.verify_uv_available", lambda: True)
 
     state_manager = StateManager(state_file)
     state_manager.add_script(
@@ -575,3 +594,39 @@ def test_cli_list_verbose_reports_uv_managed_changes_as_non_blocking(tmp_path: P
     assert result.exit_code == 0, result.output
     assert "Local" in result.output
     assert "Managed" in result.output
+
+
+def test_cli_list_does_not_require_uv(tmp_path: Path, monkeypatch) -> None:
+    """list should work without uv on PATH, while uv-backed commands still fail early."""
+    runner = CliRunner()
+    config_path = tmp_path / "config.toml"
+    _write_config(config_path, tmp_path / "repos", tmp_path / "bin", tmp_path / "state.json")
+
+    def _missing_uv() -> None:
+        raise ScriptInstallerError("UV is not installed or not in PATH")
+
+    monkeypatch.setattr("uv_script_manager.script_installer.verify_uv_available", _missing_uv)
+
+    list_result = runner.invoke(cli, ["--config", str(config_path), "list"])
+    assert list_result.exit_code == 0, list_result.output
+
+    install_result = runner.invoke(cli, ["--config", str(config_path), "install", str(tmp_path)])
+    assert install_result.exit_code == 1
+    assert "UV is not installed" in install_result.output
+
+
+def test_cli_list_without_state_file_does_not_create_it(tmp_path: Path) -> None:
+    """list on a fresh install should report no scripts without creating the state database."""
+    state_file = tmp_path / "state.json"
+    config_path = tmp_path / "config.toml"
+    _write_config(config_path, tmp_path / "repos", tmp_path / "bin", state_file)
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ["--config", str(config_path), "list"])
+    filtered = runner.invoke(cli, ["--config", str(config_path), "list", "--status", "pinned"])
+
+    assert result.exit_code == 0, result.output
+    assert result.output == "No scripts installed.\n"
+    assert filtered.exit_code == 0, filtered.output
+    assert filtered.output == "No scripts matched the provided filters.\n"
+    assert not state_file.exists()
@@ -115,7 +115,7 @@ def test_cli_show_json_outputs_parseable_payload(tmp_path: Path, monkeypatch) ->
     config_path = tmp_path / "config.toml"
     _write_config(config_path, repo_dir, install_dir, state_file)
 
-    monkeypatch.setattr("uv_script_manager.cli.verify_uv_available", lambda: True)
+    monkeypatch.setattr("uv_script_manager.script_installer.verify_uv_available", lambda: True)
 
     state_manager = StateManager(state_file)
     state_manager.add_script(
@@ -27,7 +27,7 @@ def test_cli_update_nonexistent_script(tmp_path: Path, monkeypatch) -> None:
     _write_config(config_path, tmp_path / "repos", tmp_path / "bin", tmp_path / "state.json")
 
     monkeypatch.setenv("UV_SCRIPT_MANAGER_CONFIG", str(config_path))
-    monkeypatch.setattr("uv_script_manager.cli.verify_uv_available", lambda: True)
+    monkeypatch.setattr("uv_script_manager.script_installer.verify_uv_available", lambda: True)
 
     result = runner.invoke(cli, ["update", "nonexistent.py"])
 
@@ -43,7 +43,7 @@ def test_cli_update_requires_script_name_or_all(tmp_path: Path, monkeypatch) ->
     _write_config(config_path, tmp_path / "repos", tmp_path / "bin", tmp_path / "state.json")
 
     monkeypatch.setenv("UV_SCRIPT_MANAGER_CONFIG", str(config_path))
-    monkeypatch.setattr("uv_script_manager.cli.verify_uv_available", lambda: True)
+    monkeypatch.setattr("uv_script_manager.script_installer.verify_uv_available", lambda: True)
 
     result = runner.invoke(cli, ["update"])
 
@@ -59,7 +59,7 @@ def test_cli_update_rejects_script_name_with_all(tmp_path: Path, monkeypatch) ->
     _write_config(config_path, tmp_path / "repos", tmp_path / "bin", tmp_path / "state.json")
 
     monkeypatch.setenv("UV_SCRIPT_MANAGER_CONFIG", str(config_path))
-    monkeypatch.setattr("uv_script_manager.cli.verify_uv_available", lambda: True)
+    monkeypatch.setattr("uv_script_manager.script_installer.verify_uv_available", lambda: True)
 
     result = runner.invoke(cli, ["update", "tool.py", "--all"])
 
@@ -78,7 +78,7 @@ def test_cli_update_all_prints_impact_summary(tmp_path: Path, monkeypatch) -> No
     _write_config(config_path, repo_dir, install_dir, state_file)
 
     monkeypatch.setenv("UV_SCRIPT_MANAGER_CONFIG", str(config_path))
-    monkeypatch.setattr("uv_script_manager.cli.verify_uv_available", lambda: True)
+    monkeypatch.setattr("uv_script_manager.script_installer.verify_uv_available", lambda: True)
 
     state_manager = StateManager(state_file)
     state_manager.add_script(
@@ -108,7 +108,7 @@ def test_cli_update_all_alias_is_hidden_but_still_available(tmp_path: Path, monk
     _write_config(config_path, tmp_path / "repos", tmp_path / "bin", tmp_path / "state.json")
 
     monkeypatch.setenv("UV_SCRIPT_MANAGER_CONFIG", str(config_path))
-    monkeypatch.setattr("uv_script_manager.cli.verify_uv_available", lambda: True)
+    monkeypatch.setattr("uv_script_manager.script_installer.verify_uv_available", lambda: True)
 
     help_result = runner.invoke(cli, ["--help"])
     assert help_result.exit_code == 0, help_result.output
@@ -132,7 +132,7 @@ def test_cli_update_all_dry_run_hides_local_changes_when_all_values_are_na(
     _write_config(config_path, repo_dir, install_dir, state_file)
 
     monkeypatch.setenv("UV_SCRIPT_MANAGER_CONFIG", str(config_path))
-    monkeypatch.setattr("uv_script_manager.cli.verify_uv_available", lambda: True)
+    monkeypatch.setattr("uv_script_manager.script_installer.verify_uv_available", lambda: True)
 
     state_manager = StateManager(state_file)
     state_manager.add_script(
@@ -163,7 +163,7 @@ def test_cli_local_update_without_copy_parent_dir(tmp_path: Path, monkeypatch) -
     _write_config(config_path, repo_dir, install_dir, state_file)
 
     monkeypatch.setenv("UV_SCRIPT_MANAGER_CONFIG", str(config_path))
-    monkeypatch.setattr("uv_script_manager.cli.verify_uv_available", lambda: True)
+    monkeypatch.setattr("uv_script_manager.script_installer.verify_uv_available", lambda: True)
     monkeypatch.setattr("uv_script_manager.commands.update.verify_git_available", lambda: None)
     monkeypatch.setattr("uv_script_manager.script_installer.process_script_dependencies", lambda p, d: True)
     monkeypatch.setattr("uv_script_manager.script_installer.verify_script", lambda _: True)
@@ -210,7 +210,7 @@ def test_cli_local_update_with_copy_parent_dir(tmp_path: Path, monkeypatch) -> N
     _write_config(config_path, repo_dir, install_dir, state_file)
 
     monkeypatch.setenv("UV_SCRIPT_MANAGER_CONFIG", str(config_path))
-    monkeypatch.setattr("uv_script_manager.cli.verify_uv_available", lambda: True)
+    monkeypatch.setattr("uv_script_manager.script_installer.verify_uv_available", lambda: True)
     monkeypatch.setattr("uv_script_manager.commands.update.verify_git_available", lambda: None)
     monkeypatch.setattr("uv_script_manager.script_installer.process_script_dependencies", lambda p, d: True)
     monkeypatch.setattr("uv_script_manager.script_installer.verify_script", lambda _: True)
@@ -413,7 +413,7 @@ def test_cli_update_json_outputs_parseable_payload(tmp_path: Path, monkeypatch)
     config_path = tmp_path / "config.toml"
     _write_config(config_path, repo_dir, install_dir, state_file)
 
-    monkeypatch.setattr("uv_script_manager.cli.verify_uv_available", lambda: True)
+    monkeypatch.setattr("uv_script_manager.script_installer.verify_uv_available", lambda: True)
 
     state_manager = StateManager(state_file)
     state_manager.add_script(
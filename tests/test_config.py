@@ -4,8 +4,11 @@ import tomllib
 from pathlib import Path
 
 import pytest
+from click.testing import CliRunner
 
+import uv_script_manager.config as config_module
 import uv_script_manager.migrations.config.base as config_migrations_base
+from uv_script_manager.cli import cli
 from uv_script_manager.config import (
     CURRENT_CONFIG_SCHEMA_VERSION,
     DEFAULT_CONFIG_TEMPLATE_PATH,
@@ -194,6 +197,26 @@ class TestCreateDefaultConfig:
         assert "~" not in str(config.install_dir)
         assert "~" not in str(config.state_file)
 
+    def test_default_template_is_parsed_once(self, monkeypatch) -> None:
+        """Repeated default configs should reuse one template parse without sharing state."""
+        config_module._parse_default_template.cache_clear()
+        parse_count = {"count": 0}
+        original_load = tomllib.load
+
+        def counting_load(f):
+            parse_count["count"] += 1
+            return original_load(f)
+
+        monkeypatch.setattr(config_module.tomllib, "load", counting_load)
+
+        first = config_module._load_default_template()
+        first["global"]["git"]["clone_depth"] = 99
+        second = config_module._load_default_template()
+        create_default_config()
+
+        assert parse_count["count"] == 1
+        assert second["global"]["git"]["clone_depth"] == 1
+
 
 class TestLoadConfig:
     """Tests for load_config function."""
@@ -322,6 +345,32 @@ use_exact_flag = false
         assert config.auto_chmod is False
         assert config.use_exact_flag is False
 
+    def test_load_config_reuses_parse_until_file_changes(self, tmp_path: Path, monkeypatch) -> None:
+        """Test that unchanged config files are parsed once and edits are picked up."""
+        config_file = tmp_path / "config.toml"
+        header = f"[meta]\nschema_version = {CURRENT_CONFIG_SCHEMA_VERSION}\n\n[global.git]\n"
+        config_file.write_text(f"{header}clone_depth = 3\n", encoding="utf-8")
+
+        parse_calls = 0
+        original_load = tomllib.load
+
+        def counting_load(fp):
+            nonlocal parse_calls
+            if fp.name == str(config_file):
+                parse_calls += 1
+            return original_load(fp)
+
+        monkeypatch.setattr(tomllib, "load", counting_load)
+
+        first = load_config(config_file)
+        second = load_config(config_file)
+        assert first.clone_depth == second.clone_depth == 3
+        assert first is not second
+        assert parse_calls == 1
+
+        config_file.write_text(f"{header}clone_depth = 12\n", encoding="utf-8")
+        assert load_config(config_file).clone_depth == 12
+
     def test_load_config_creates_default_if_missing(self, tmp_path: Path) -> None:
         """Test that load_config creates default config if file doesn't exist."""
         config_file = tmp_path / "nonexistent.toml"
@@ -385,6 +434,25 @@ clone_depth = 10
         with pytest.raises(tomllib.TOMLDecodeError):
             load_config(config_file)
 
+    def test_load_config_without_create_raises_for_missing_file(self, tmp_path: Path) -> None:
+        """Test that an explicit missing config is reported instead of created."""
+        config_file = tmp_path / "missing.toml"
+
+        with pytest.raises(FileNotFoundError, match="Config file not found"):
+            load_config(config_file, create_if_missing=False)
+
+        assert not config_file.exists()
+
+    def test_cli_missing_config_option_fails_without_creating_file(self, tmp_path: Path) -> None:
+        """An explicit --config path that does not exist should be an error, not a new file."""
+        config_path = tmp_path / "missing.toml"
+
+        result = CliRunner().invoke(cli, ["--config", str(config_path), "list"])
+
+        assert result.exit_code == 1
+        assert "Config file not found" in result.output
+        assert not config_path.exists()
+
     def test_load_config_saves_default(self, tmp_path: Path) -> None:
         """Test that missing config is created by copying repository template."""
         config_file = tmp_path / "new-config.toml"
@@ -4,6 +4,7 @@ from pathlib import Path
 
 import pytest
 
+import uv_script_manager.deps as deps_module
 from uv_script_manager.deps import (
     parse_dependencies_string,
     parse_requirements_file,
@@ -93,6 +94,28 @@ class TestParseRequirementsFile:
         with pytest.raises(FileNotFoundError):
             parse_requirements_file(req_file)
 
+    def test_reuses_parse_until_file_changes(self, tmp_path: Path, monkeypatch) -> None:
+        """Unchanged files should be parsed once; edits should be picked up."""
+        req_file = tmp_path / "requirements.txt"
+        req_file.write_text("requests\n")
+        parse_calls = {"count": 0}
+        original_parse = deps_module.requirements.parse
+
+        def counting_parse(f):
+            parse_calls["count"] += 1
+            return original_parse(f)
+
+        monkeypatch.setattr(deps_module.requirements, "parse", counting_parse)
+
+        first = parse_requirements_file(req_file)
+        first.append("mutated")
+        assert parse_requirements_file(req_file) == ["requests"]
+        assert parse_calls["count"] == 1
+
+        req_file.write_text("requests\nclick>=8.0\n")
+        assert parse_requirements_file(req_file) == ["requests", "click>=8.0"]
+        assert parse_calls["count"] == 2
+
 
 class TestParseDependenciesString:
     """Tests for parse_dependencies_string function."""
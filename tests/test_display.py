@@ -0,0 +1,35 @@
+"""Tests for display helpers."""
+
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from uv_script_manager.constants import SourceType
+from uv_script_manager.display import get_script_source_display
+from uv_script_manager.state import ScriptInfo
+
+
+@pytest.mark.parametrize(
+    ("source_url", "expected"),
+    [
+        ("https://github.com/acme/repo", "acme/repo"),
+        ("https://github.com/acme/repo/", "acme/repo"),
+        ("https://gitlab.com/group/sub/repo.git", "sub/repo.git"),
+        ("git@github.com:acme/repo.git", "git@github.com:acme/repo.git"),
+        ("ssh://git@example.com/acme/repo", "acme/repo"),
+        ("repo", "repo"),
+    ],
+)
+def test_get_script_source_display_shortens_git_urls(source_url: str, expected: str) -> None:
+    """Git sources should display their last two path segments."""
+    script = ScriptInfo(
+        name="tool.py",
+        source_type=SourceType.GIT,
+        source_url=source_url,
+        installed_at=datetime.now(),
+        repo_path=Path("/tmp/repo"),
+    )
+
+    assert get_script_source_display(script) == expected
+    assert get_script_source_display(script, shorten_git=False) == source_url
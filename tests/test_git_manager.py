@@ -154,6 +154,16 @@ class TestParseGitUrl:
         assert result.ref_type == "commit"
         assert result.ref_value == "deadbeef"
 
+    def test_repeated_parse_returns_independent_refs(self) -> None:
+        """Cached URL normalization should not share GitRef instances between callers."""
+        first = parse_git_url("https://github.com/user/repo@v1.0.0")
+        first.ref_value = "changed"
+
+        second = parse_git_url("https://github.com/user/repo@v1.0.0")
+
+        assert second is not first
+        assert second.ref_value == "v1.0.0"
+
 
 class TestGitRef:
     """Tests for GitRef dataclass."""
@@ -309,3 +319,39 @@ class TestCloneOrUpdateIntegration:
         assert is_detached_head(clone_path) is True
 
         assert get_default_branch(clone_path) == "main"
+
+    def test_clone_or_update_commit_ref_stays_shallow(self, tmp_path: Path) -> None:
+        """Cloning at an older commit should fetch only that commit, not its history."""
+        origin, _tag_commit, head_commit = _create_origin_repo_with_tag(tmp_path)
+        (origin / "tool.py").write_text("print('v3')\n", encoding="utf-8")
+        _run_git(
+            origin,
+            "-c",
+            "user.name=Test User",
+            "-c",
+            "user.email=test@example.com",
+            "commit",
+            "-am",
+            "c3",
+        )
+        commit = _run_git(origin, "rev-parse", "HEAD~1")
+        clone_path = tmp_path / "clone"
+
+        # file:// so git honours --depth for a local origin
+        clone_or_update(origin.as_uri(), commit, clone_path, depth=1, ref_type="commit")
+
+        assert get_current_commit_hash(clone_path) == head_commit
+        assert _run_git(clone_path, "rev-list", "--count", "HEAD") == "1"
+
+    def test_clone_or_update_skips_fetch_when_already_at_commit(self, tmp_path: Path) -> None:
+        """Re-requesting the checked-out commit should not contact the remote."""
+        origin, tag_commit, _head_commit = _create_origin_repo_with_tag(tmp_path)
+        commit = _run_git(origin, "rev-parse", "v1.0.0")
+        clone_path = tmp_path / "clone"
+        clone_or_update(origin.as_uri(), commit, clone_path, ref_type="commit")
+
+        # An unreachable origin makes any fetch fail
+        origin.rename(tmp_path / "moved")
+        clone_or_update(origin.as_uri(), commit[:GIT_SHORT_HASH_LENGTH], clone_path, ref_type="commit")
+
+        assert get_current_commit_hash(clone_path) == tag_commit
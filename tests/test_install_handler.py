@@ -1,5 +1,6 @@
 """Tests for InstallHandler branch coverage and behavior."""
 
+import threading
 from datetime import datetime
 from pathlib import Path
 
@@ -15,7 +16,7 @@ from uv_script_manager.commands.install import (
 from uv_script_manager.config import load_config
 from uv_script_manager.constants import SourceType
 from uv_script_manager.git_manager import GitRef
-from uv_script_manager.script_installer import ScriptInstallerError
+from uv_script_manager.script_installer import InstallConfig, ScriptInstallerError
 from uv_script_manager.state import ScriptInfo
 
 
@@ -195,12 +196,9 @@ def test_install_single_script_invalid_and_missing_paths(tmp_path: Path) -> None
         git_ref=None,
     )
     options = ScriptInstallOptions(
-        dependencies=[],
-        install_directory=install_dir,
-        no_symlink=True,
-        exact=None,
-        add_source_package=None,
-        alias=None,
+        dependencies=(),
+        source_package=None,
+        install_config=InstallConfig(install_dir=install_dir, auto_symlink=False),
     )
 
     invalid = handler._install_single_script("bad\x00.py", local_context, options)
@@ -245,12 +243,9 @@ def test_install_single_script_git_success_warns_and_handles_installer_error(
         git_ref=GitRef(base_url="https://github.com/acme/repo", ref_type="branch", ref_value="main"),
     )
     options = ScriptInstallOptions(
-        dependencies=["requests"],
-        install_directory=install_dir,
-        no_symlink=False,
-        exact=True,
-        add_source_package="",
-        alias="short",
+        dependencies=("requests", "git-repo"),
+        source_package="git-repo",
+        install_config=InstallConfig(install_dir=install_dir, use_exact=True, script_alias="short"),
     )
 
     monkeypatch.setattr("uv_script_manager.commands.install.add_package_source", lambda *args, **kwargs: None)
@@ -276,3 +271,177 @@ def test_install_single_script_git_success_warns_and_handles_installer_error(
     )
     failure = handler._install_single_script("tool.py", context, options)
     assert failure == ("tool.py", False, "install failed")
+
+
+def test_handle_git_source_checks_git_once_per_handler(tmp_path: Path, monkeypatch) -> None:
+    """Repeated git installs through one handler should probe for git only once."""
+    handler, _repo_dir, _install_dir, _state_file, _config_path = _build_handler(tmp_path)
+
+    verify_calls = {"count": 0}
+
+    def counting_verify() -> None:
+        verify_calls["count"] += 1
+
+    monkeypatch.setattr("uv_script_manager.commands.install.verify_git_available", counting_verify)
+    monkeypatch.setattr("uv_script_manager.commands.install.clone_or_update", lambda *args, **kwargs: None)
+    monkeypatch.setattr("uv_script_manager.commands.install.get_current_commit_hash", lambda repo: "deadbeef")
+
+    handler._handle_git_source("https://github.com/acme/one@main")
+    handler._handle_git_source("https://github.com/acme/two@main")
+
+    assert verify_calls["count"] == 1
+
+
+def test_install_runs_multiple_scripts_concurrently_in_order(tmp_path: Path, monkeypatch) -> None:
+    """Multi-script installs should overlap, keep result order, and record every script."""
+    handler, _repo_dir, install_dir, _state_file, _config_path = _build_handler(tmp_path)
+
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    for name in ("alpha.py", "beta.py"):
+        (source_dir / name).write_text("print('x')\n", encoding="utf-8")
+
+    # Both installs must be in flight at once for the barrier to release
+    barrier = threading.Barrier(2, timeout=5)
+    install_configs = []
+
+    def fake_install_script(script_path, deps, install_config):
+        install_configs.append(install_config)
+        barrier.wait()
+        return install_dir / script_path.stem, None
+
+    monkeypatch.setattr("uv_script_manager.commands.install.install_script", fake_install_script)
+
+    request = InstallRequest(
+        with_deps=None,
+        force=True,
+        no_symlink=False,
+        install_dir=None,
+        verbose=False,
+        exact=None,
+        copy_parent_dir=False,
+        add_source_package=None,
+        alias=None,
+        no_deps=True,
+    )
+    results = handler.install(str(source_dir), ("alpha.py", "beta.py"), request)
+
+    assert results == [
+        ("alpha.py", True, install_dir / "alpha"),
+        ("beta.py", True, install_dir / "beta"),
+    ]
+    stored = handler.state_manager.list_scripts()
+    assert {script.name for script in stored} == {"alpha.py", "beta.py"}
+    # Scripts from one install() call share its timestamp
+    assert len({script.installed_at for script in stored}) == 1
+    # ...and one InstallConfig
+    assert install_configs[0] is install_configs[1]
+
+
+def test_check_existing_scripts_skips_state_lookup_when_forced(tmp_path: Path, monkeypatch) -> None:
+    """--force should proceed without reading installed scripts from state."""
+    handler, _repo_dir, _install_dir, _state_file, _config_path = _build_handler(tmp_path)
+
+    def fail_lookup(names):
+        raise AssertionError("state should not be read")
+
+    monkeypatch.setattr(handler.state_manager, "get_existing_names", fail_lookup)
+
+    assert handler._check_existing_scripts(("tool.py",), force=True) is True
+
+
+def test_install_resolves_source_package_once_for_all_scripts(tmp_path: Path, monkeypatch) -> None:
+    """Every script should get the source package added once, named after the copied directory."""
+    handler, _repo_dir, install_dir, _state_file, _config_path = _build_handler(tmp_path)
+
+    source_dir = tmp_path / "mypkg"
+    source_dir.mkdir()
+    for name in ("alpha.py", "beta.py"):
+        (source_dir / name).write_text("print('x')\n", encoding="utf-8")
+
+    added = []
+    monkeypatch.setattr(
+        "uv_script_manager.commands.install.add_package_source",
+        lambda script_path, pkg_name, repo_path: added.append((script_path.name, pkg_name)),
+    )
+    monkeypatch.setattr(
+        "uv_script_manager.commands.install.install_script",
+        lambda script_path, deps, install_config: (install_dir / script_path.stem, None),
+    )
+
+    request = InstallRequest(
+        with_deps="requests,mypkg",
+        force=True,
+        no_symlink=False,
+        install_dir=None,
+        verbose=False,
+        exact=None,
+        copy_parent_dir=True,
+        add_source_package="",
+        alias=None,
+        no_deps=False,
+    )
+    handler.install(str(source_dir), ("alpha.py", "beta.py"), request)
+
+    assert sorted(added) == [("alpha.py", "mypkg"), ("beta.py", "mypkg")]
+    for script in handler.state_manager.list_scripts():
+        assert script.dependencies == ["requests", "mypkg"]
+
+
+def test_install_git_source_skips_local_directory_check(tmp_path: Path, monkeypatch) -> None:
+    """A Git URL source should be recognised without probing the filesystem for a directory."""
+    handler, _repo_dir, _install_dir, _state_file, _config_path = _build_handler(tmp_path)
+
+    def fail_local_check(path: str) -> bool:
+        raise AssertionError("local directory check should not run for a Git URL")
+
+    monkeypatch.setattr("uv_script_manager.commands.install.is_local_directory", fail_local_check)
+    monkeypatch.setattr(handler, "_check_existing_scripts", lambda scripts, force: False)
+
+    request = InstallRequest(
+        with_deps=None,
+        force=False,
+        no_symlink=False,
+        install_dir=None,
+        verbose=False,
+        exact=None,
+        copy_parent_dir=False,
+        add_source_package=None,
+        alias=None,
+        no_deps=True,
+    )
+
+    assert handler.install("https://github.com/acme/repo", ("tool.py",), request) == []
+
+
+def test_install_deduplicates_repeated_script_names(tmp_path: Path, monkeypatch) -> None:
+    """A script passed twice should be installed once, not by two concurrent workers."""
+    handler, _repo_dir, install_dir, _state_file, _config_path = _build_handler(tmp_path)
+
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    (source_dir / "alpha.py").write_text("print('x')\n", encoding="utf-8")
+    installed: list[str] = []
+
+    def fake_install_script(script_path, deps, install_config):
+        installed.append(script_path.name)
+        return install_dir / script_path.stem, None
+
+    monkeypatch.setattr("uv_script_manager.commands.install.install_script", fake_install_script)
+
+    request = InstallRequest(
+        with_deps=None,
+        force=True,
+        no_symlink=False,
+        install_dir=None,
+        verbose=False,
+        exact=None,
+        copy_parent_dir=False,
+        add_source_package=None,
+        alias=None,
+        no_deps=True,
+    )
+    results = handler.install(str(source_dir), ("alpha.py", "alpha.py"), request)
+
+    assert results == [("alpha.py", True, install_dir / "alpha")]
+    assert installed == ["alpha.py"]
@@ -146,3 +146,12 @@ def test_remove_re_raises_script_installer_error(tmp_path: Path, monkeypatch) ->
         handler.remove("tool.py", clean_repo=False, force=True)
 
     assert "Error:" in handler.console.export_text()
+
+
+def test_remove_handler_reuses_provided_state_manager(tmp_path: Path) -> None:
+    """A state manager passed in by the caller should be used instead of a new one."""
+    handler = _build_handler(tmp_path)
+
+    shared = RemoveHandler(handler.config, handler.console, handler.state_manager)
+
+    assert shared.state_manager is handler.state_manager
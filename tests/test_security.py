@@ -10,6 +10,7 @@ from click.testing import CliRunner
 
 from tests.cli_helpers import _write_config
 from uv_script_manager.cli import cli
+from uv_script_manager.commands.install import _validate_script_name
 from uv_script_manager.script_installer import ScriptInstallerError, create_symlink
 from uv_script_manager.state import StateManager
 from uv_script_manager.utils import safe_rmtree
@@ -155,7 +156,7 @@ class TestValidationCoverage:
         (source_dir / "tool.py").write_text("print('tool')\n", encoding="utf-8")
         (tmp_path / "outside.py").write_text("print('outside')\n", encoding="utf-8")
 
-        monkeypatch.setattr("uv_script_manager.cli.verify_uv_available", lambda: True)
+        monkeypatch.setattr("uv_script_manager.script_installer.verify_uv_available", lambda: True)
 
         result = runner.invoke(
             cli,
@@ -175,6 +176,28 @@ class TestValidationCoverage:
         assert StateManager(state_file).get_script("../outside.py") is None
         assert not (repo_dir / "outside.py").exists()
 
+    @pytest.mark.parametrize(
+        "script_name",
+        [
+            "../outside.py",
+            "a/./../b.py",
+            "a\\..\\b.py",
+            "./C:/x.py",
+            "C:x.py",
+            "sub/C:x.py",
+            "/etc/x.py",
+            "\\x.py",
+        ],
+    )
+    def test_script_name_validation_rejects_traversal(self, script_name: str) -> None:
+        """Parent segments and absolute or drive-prefixed names should be rejected."""
+        assert _validate_script_name(script_name) is not None
+
+    @pytest.mark.parametrize("script_name", ["tool.py", "tools/run.py", "./tool.py", "tools//run.py"])
+    def test_script_name_validation_accepts_relative_paths(self, script_name: str) -> None:
+        """Plain relative script paths should pass validation."""
+        assert _validate_script_name(script_name) is None
+
     def test_alias_validation_in_create_symlink(self, tmp_path: Path) -> None:
         """Test that alias names are validated."""
         script_path = tmp_path / "script.py"
@@ -1,5 +1,9 @@
 """Tests for state module."""
 
+import json
+import os
+import stat
+import sys
 from datetime import datetime
 from pathlib import Path
 
@@ -7,7 +11,7 @@ import pytest
 from pydantic import ValidationError
 
 from uv_script_manager.constants import SourceType
-from uv_script_manager.state import ScriptInfo, StateManager
+from uv_script_manager.state import AtomicJSONStorage, ScriptInfo, StateManager
 
 
 class TestScriptInfo:
@@ -94,6 +98,73 @@ class TestScriptInfo:
         assert script.dependencies == []
 
 
+class TestAtomicJSONStorage:
+    """Tests for the atomic TinyDB storage."""
+
+    def test_write_replaces_file_without_leaving_temp_file(self, tmp_path: Path) -> None:
+        """Writes should round-trip and leave only the state file behind."""
+        state_file = tmp_path / "state.json"
+        storage = AtomicJSONStorage(state_file)
+
+        assert state_file.exists()
+        assert storage.read() is None
+
+        storage.write({"scripts": {"1": {"name": "a.py"}}})
+
+        assert storage.read() == {"scripts": {"1": {"name": "a.py"}}}
+        assert [path.name for path in tmp_path.iterdir()] == ["state.json"]
+
+    def test_failed_write_keeps_previous_contents(self, tmp_path: Path) -> None:
+        """A write that fails midway should not touch the existing state file."""
+        state_file = tmp_path / "state.json"
+        storage = AtomicJSONStorage(state_file)
+        storage.write({"scripts": {}})
+
+        with pytest.raises(TypeError):
+            storage.write({"scripts": {"1": {"bad": object()}}})
+
+        assert storage.read() == {"scripts": {}}
+        assert [path.name for path in tmp_path.iterdir()] == ["state.json"]
+
+    def test_writes_use_unique_temp_files(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Each write should use its own temp file so concurrent processes cannot clobber it."""
+        state_file = tmp_path / "state.json"
+        storage = AtomicJSONStorage(state_file)
+        temp_paths: list[str] = []
+        real_replace = os.replace
+
+        def record_replace(src: str, dst: Path) -> None:
+            temp_paths.append(str(src))
+            real_replace(src, dst)
+
+        monkeypatch.setattr("uv_script_manager.state.os.replace", record_replace)
+        storage.write({"scripts": {}})
+        storage.write({"scripts": {}})
+
+        assert len(set(temp_paths)) == 2
+        assert all(Path(path).parent == tmp_path for path in temp_paths)
+        assert str(tmp_path / "state.json.tmp") not in temp_paths
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions and symlinks")
+    def test_write_keeps_symlink_and_permissions(self, tmp_path: Path) -> None:
+        """Writing through a symlinked state file should update the target in place."""
+        real_dir = tmp_path / "real"
+        real_dir.mkdir()
+        real_file = real_dir / "state.json"
+        real_file.write_text("", encoding="utf-8")
+        real_file.chmod(0o640)
+        link = tmp_path / "state.json"
+        link.symlink_to(real_file)
+
+        storage = AtomicJSONStorage(link)
+        storage.write({"scripts": {"1": {"name": "a.py"}}})
+
+        assert link.is_symlink()
+        assert json.loads(real_file.read_text(encoding="utf-8")) == {"scripts": {"1": {"name": "a.py"}}}
+        assert stat.S_IMODE(real_file.stat().st_mode) == 0o640
+        assert [path.name for path in real_dir.iterdir()] == ["state.json"]
+
+
 class TestStateManager:
     """Tests for StateManager class with TinyDB."""
 
@@ -285,6 +356,128 @@ class TestStateManager:
         all_scripts = manager.list_scripts()
         assert len(all_scripts) == 1
 
+    def test_batch_defers_writes_and_keeps_existing_entries_in_place(
+        self, tmp_path: Path, monkeypatch
+    ) -> None:
+        """add_script inside batch() should write once at exit and update existing entries in place."""
+        manager = StateManager(tmp_path / "state.json")
+
+        def make_script(name: str, commit_hash: str) -> ScriptInfo:
+            return ScriptInfo(
+                name=name,
+                source_type=SourceType.GIT,
+                source_url="https://github.com/user/repo",
+                installed_at=datetime(2025, 1, 1),
+                repo_path=Path("/tmp/repo"),
+                commit_hash=commit_hash,
+            )
+
+        manager.add_script(make_script("first.py", "old"))
+        manager.add_script(make_script("second.py", "old"))
+
+        write_count = {"count": 0}
+        original_write = manager.db.storage.write
+
+        def counting_write(data) -> None:
+            write_count["count"] += 1
+            original_write(data)
+
+        monkeypatch.setattr(manager.db.storage, "write", counting_write)
+
+        with manager.batch():
+            manager.add_script(make_script("first.py", "new"))
+            manager.add_script(make_script("third.py", "new"))
+            manager.add_script(make_script("fourth.py", "new"))
+            assert manager.get_script("third.py") is None
+            assert write_count["count"] == 0
+
+        assert write_count["count"] == 2
+        assert [script.name for script in manager.list_scripts()] == [
+            "first.py",
+            "second.py",
+            "third.py",
+            "fourth.py",
+        ]
+        first = manager.get_script("first.py")
+        assert first is not None
+        assert first.commit_hash == "new"
+
+    def test_get_existing_names_reads_state_once(self, tmp_path: Path, monkeypatch) -> None:
+        """get_existing_names should answer for many names with one storage read."""
+        manager = StateManager(tmp_path / "state.json")
+        for name in ("a.py", "b.py"):
+            manager.add_script(
+                ScriptInfo(
+                    name=name,
+                    source_type=SourceType.LOCAL,
+                    installed_at=datetime(2025, 1, 1),
+                    repo_path=Path("/tmp/repo"),
+                )
+            )
+
+        read_count = {"count": 0}
+        original_read = manager.db.storage.read
+
+        def counting_read():
+            read_count["count"] += 1
+            return original_read()
+
+        monkeypatch.setattr(manager.db.storage, "read", counting_read)
+
+        assert manager.get_existing_names(["a.py", "missing.py", "b.py"]) == {"a.py", "b.py"}
+        assert manager.get_existing_names([]) == set()
+        assert read_count["count"] == 1
+
+    def test_get_script_flexible_matches_name_then_alias_with_one_read(
+        self, tmp_path: Path, monkeypatch
+    ) -> None:
+        """Flexible lookup should prefer names, fall back to aliases, and read state once."""
+        manager = StateManager(tmp_path / "state.json")
+        for name, alias in (("tool.py", "tool"), ("other.py", "tool.py")):
+            manager.add_script(
+                ScriptInfo(
+                    name=name,
+                    source_type=SourceType.LOCAL,
+                    installed_at=datetime(2025, 1, 1),
+                    repo_path=Path("/tmp/repo"),
+                    symlink_path=tmp_path / "bin" / alias,
+                )
+            )
+
+        read_count = {"count": 0}
+        original_read = manager.db.storage.read
+
+        def counting_read():
+            read_count["count"] += 1
+            return original_read()
+
+        monkeypatch.setattr(manager.db.storage, "read", counting_read)
+
+        by_alias = manager.get_script_flexible("tool")
+        assert by_alias is not None and by_alias.name == "tool.py"
+        assert read_count["count"] == 1
+
+        by_name = manager.get_script_flexible("tool.py")
+        assert by_name is not None and by_name.name == "tool.py"
+        assert manager.get_script_flexible("missing") is None
+
+    def test_batch_writes_queued_scripts_when_block_raises(self, tmp_path: Path) -> None:
+        """Scripts queued before an error should still be recorded."""
+        manager = StateManager(tmp_path / "state.json")
+
+        with pytest.raises(RuntimeError), manager.batch():
+            manager.add_script(
+                ScriptInfo(
+                    name="done.py",
+                    source_type=SourceType.LOCAL,
+                    installed_at=datetime(2025, 1, 1),
+                    repo_path=Path("/tmp/repo"),
+                )
+            )
+            raise RuntimeError("later install failed")
+
+        assert manager.get_script("done.py") is not None
+
     def test_empty_state(self, tmp_path: Path) -> None:
         """Test that a new StateManager starts with empty state."""
         state_file = tmp_path / "state.json"
@@ -356,3 +549,39 @@ class TestStateManager:
         issues = manager.validate_state()
 
         assert any("Symlink points to wrong target" in issue for issue in issues)
+
+    def test_validate_and_repair_matches_separate_passes(self, tmp_path: Path) -> None:
+        """Test validate_and_repair reports the same issues and repairs as the two-step flow."""
+        state_file = tmp_path / "state.json"
+        manager = StateManager(state_file)
+
+        repo_path = tmp_path / "repo"
+        repo_path.mkdir()
+        (repo_path / "ok.py").write_text("print('ok')\n", encoding="utf-8")
+        manager.add_script(
+            ScriptInfo(
+                name="ok.py",
+                source_type=SourceType.GIT,
+                installed_at=datetime.now(),
+                repo_path=repo_path,
+                symlink_path=tmp_path / "bin" / "ok.py",
+            )
+        )
+        manager.add_script(
+            ScriptInfo(
+                name="gone.py",
+                source_type=SourceType.GIT,
+                installed_at=datetime.now(),
+                repo_path=tmp_path / "missing-repo",
+            )
+        )
+
+        expected_issues = manager.validate_state()
+        expected_report = manager.repair_state(auto_fix=False)
+
+        issues, report = manager.validate_and_repair(auto_fix=True)
+
+        assert issues == expected_issues
+        assert report == expected_report == {"broken_symlinks_removed": 1, "missing_scripts_removed": 1}
+        assert manager.get_script("gone.py") is None
+        assert manager.get_script("ok.py") is not None
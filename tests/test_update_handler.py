@@ -1,5 +1,6 @@
 """Tests for UpdateHandler behavior and edge branches."""
 
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import cast
@@ -147,7 +148,7 @@ def test_update_all_collects_errors_for_dry_and_apply_modes(tmp_path: Path, monk
     monkeypatch.setattr(
         handler,
         "_update_git_script_internal",
-        lambda script_info, force, exact, refresh_deps=False: (_ for _ in ()).throw(
+        lambda script_info, force, exact, refresh_deps=False, show_spinner=True: (_ for _ in ()).throw(
             ScriptInstallerError("apply boom")
         ),
     )
@@ -415,3 +416,152 @@ def test_check_git_script_update_status_variants(tmp_path: Path, monkeypatch) ->
         )
         == "would update (local custom changes present)"
     )
+
+
+def test_update_all_checks_each_remote_once(tmp_path: Path, monkeypatch) -> None:
+    """update_all should query each (url, ref) once and surface failures per script."""
+    handler, repo_dir, _install_dir = _build_handler(tmp_path)
+    _add_git_script(handler, repo_dir / "git", name="tool.py")
+    _add_git_script(handler, repo_dir / "git", name="other.py")
+    handler.state_manager.add_script(
+        ScriptInfo(
+            name="broken.py",
+            source_type=SourceType.GIT,
+            source_url="https://github.com/acme/broken",
+            ref="main",
+            ref_type="branch",
+            installed_at=datetime.now(),
+            repo_path=repo_dir / "broken",
+            commit_hash="abc12345",
+        )
+    )
+
+    lookups: list[tuple[str, str]] = []
+
+    def fake_remote_hash(url: str, ref: str) -> str:
+        lookups.append((url, ref))
+        if url.endswith("/broken"):
+            raise GitError("remote unreachable")
+        return "abc12345"
+
+    monkeypatch.setattr("uv_script_manager.commands.update.verify_git_available", lambda: True)
+    monkeypatch.setattr("uv_script_manager.commands.update.get_remote_commit_hash", fake_remote_hash)
+
+    results = handler.update_all(force=False, exact=None, show_summary=False)
+
+    assert sorted(lookups) == [
+        ("https://github.com/acme/broken", "main"),
+        ("https://github.com/acme/repo", "main"),
+    ]
+    assert dict(cast(list[tuple[str, str]], results)) == {
+        "tool.py": "up-to-date",
+        "other.py": "up-to-date",
+        "broken.py": "Error: remote unreachable",
+    }
+    assert handler._remote_commit_hashes == {}
+
+
+def test_update_all_updates_repositories_concurrently_in_order(tmp_path: Path, monkeypatch) -> None:
+    """Different repositories should update in parallel; scripts sharing one should not overlap."""
+    handler, repo_dir, _install_dir = _build_handler(tmp_path)
+    _add_git_script(handler, repo_dir / "one", name="a.py")
+    _add_git_script(handler, repo_dir / "two", name="b.py")
+    _add_git_script(handler, repo_dir / "one", name="c.py")
+
+    # Both repositories must be in flight at once for the barrier to release
+    barrier = threading.Barrier(2, timeout=5)
+    active_repos: list[Path] = []
+    lock = threading.Lock()
+
+    def fake_update(script_info, force, exact, refresh_deps=False, show_spinner=True):
+        assert show_spinner is False
+        with lock:
+            assert script_info.repo_path not in active_repos
+            active_repos.append(script_info.repo_path)
+        if script_info.name in ("a.py", "b.py"):
+            barrier.wait()
+        with lock:
+            active_repos.remove(script_info.repo_path)
+        return f"updated {script_info.name}"
+
+    monkeypatch.setattr("uv_script_manager.commands.update.verify_git_available", lambda: True)
+    monkeypatch.setattr(handler, "_update_git_script_internal", fake_update)
+
+    results = handler.update_all(force=True, exact=None, show_summary=False)
+
+    assert results == [
+        ("a.py", "updated a.py"),
+        ("b.py", "updated b.py"),
+        ("c.py", "updated c.py"),
+    ]
+
+
+def test_forced_update_skips_fetch_when_clone_is_at_remote_commit(tmp_path: Path, monkeypatch) -> None:
+    """--force should reinstall without fetching when the clone is at the prefetched remote commit."""
+    handler, repo_dir, install_dir = _build_handler(tmp_path)
+    repo_path = repo_dir / "git"
+    repo_path.mkdir(parents=True)
+    _add_git_script(handler, repo_path)
+    script_info = handler.state_manager.get_script("tool.py")
+    assert script_info is not None
+
+    assert script_info.source_url is not None
+    assert script_info.ref is not None
+    handler._remote_commit_hashes = {(script_info.source_url, script_info.ref): "abc12345"}
+
+    monkeypatch.setattr(
+        "uv_script_manager.commands.update.get_remote_commit_hash",
+        lambda *args, **kwargs: (_ for _ in ()).throw(AssertionError("prefetched hash should be reused")),
+    )
+    monkeypatch.setattr(
+        "uv_script_manager.commands.update.get_current_commit_hash", lambda *args, **kwargs: "abc12345"
+    )
+    monkeypatch.setattr("uv_script_manager.commands.update.get_local_change_state", lambda *args: "clean")
+    monkeypatch.setattr("uv_script_manager.commands.update.get_default_branch", lambda *args: "main")
+    monkeypatch.setattr(
+        "uv_script_manager.commands.update.clone_or_update",
+        lambda *args, **kwargs: (_ for _ in ()).throw(AssertionError("clone_or_update should not run")),
+    )
+    monkeypatch.setattr(
+        "uv_script_manager.commands.update.install_script",
+        lambda script_path, dependencies, install_config: (install_dir / "tool", None),
+    )
+
+    status = handler._update_git_script_internal(script_info, force=True, exact=None, refresh_deps=False)
+
+    assert status == "updated"
+    assert script_info.commit_hash == "abc12345"
+
+
+def test_single_forced_update_does_not_query_remote(tmp_path: Path, monkeypatch) -> None:
+    """Without a prefetched hash, --force should go straight to the fetch instead of ls-remote."""
+    handler, repo_dir, install_dir = _build_handler(tmp_path)
+    repo_path = repo_dir / "git"
+    repo_path.mkdir(parents=True)
+    _add_git_script(handler, repo_path)
+    script_info = handler.state_manager.get_script("tool.py")
+    assert script_info is not None
+    clone_calls: list[str] = []
+
+    monkeypatch.setattr(
+        "uv_script_manager.commands.update.get_remote_commit_hash",
+        lambda *args, **kwargs: (_ for _ in ()).throw(AssertionError("ls-remote should not run")),
+    )
+    monkeypatch.setattr(
+        "uv_script_manager.commands.update.get_current_commit_hash", lambda *args, **kwargs: "abc12345"
+    )
+    monkeypatch.setattr("uv_script_manager.commands.update.get_local_change_state", lambda *args: "clean")
+    monkeypatch.setattr("uv_script_manager.commands.update.get_default_branch", lambda *args: "main")
+    monkeypatch.setattr(
+        "uv_script_manager.commands.update.clone_or_update",
+        lambda url, *args, **kwargs: clone_calls.append(url),
+    )
+    monkeypatch.setattr(
+        "uv_script_manager.commands.update.install_script",
+        lambda script_path, dependencies, install_config: (install_dir / "tool", None),
+    )
+
+    status = handler._update_git_script_internal(script_info, force=True, exact=None, refresh_deps=False)
+
+    assert status == "updated"
+    assert clone_calls == [script_info.source_url]
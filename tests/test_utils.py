@@ -7,6 +7,8 @@ from rich.console import Console
 
 from uv_script_manager.git_manager import GitError
 from uv_script_manager.utils import (
+    copy_directory_contents,
+    copy_script_file,
     ensure_dir,
     expand_path,
     get_repo_name_from_url,
@@ -197,3 +199,48 @@ class TestSafeRmtreeAdditionalCases:
 
         with pytest.raises(ValueError, match="Cannot safely resolve path"):
             safe_rmtree(missing)
+
+
+class TestCopyDirectoryContents:
+    """Tests for copy_directory_contents function."""
+
+    def test_copies_files_and_replaces_existing_directories(self, tmp_path: Path) -> None:
+        """Files are overwritten and existing subdirectories are replaced, not merged."""
+        source = tmp_path / "source"
+        (source / "pkg").mkdir(parents=True)
+        (source / "tool.py").write_text("new\n")
+        (source / "pkg" / "mod.py").write_text("mod\n")
+
+        dest = tmp_path / "dest"
+        (dest / "pkg").mkdir(parents=True)
+        (dest / "tool.py").write_text("old\n")
+        (dest / "pkg" / "stale.py").write_text("stale\n")
+
+        copy_directory_contents(source, dest)
+
+        assert (dest / "tool.py").read_text() == "new\n"
+        assert (dest / "pkg" / "mod.py").read_text() == "mod\n"
+        assert not (dest / "pkg" / "stale.py").exists()
+
+    def test_copy_onto_itself_leaves_directory_intact(self, tmp_path: Path) -> None:
+        """Copying a directory onto itself should be a no-op, not delete subdirectories."""
+        source = tmp_path / "source"
+        (source / "pkg").mkdir(parents=True)
+        (source / "pkg" / "mod.py").write_text("mod\n")
+        (source / "tool.py").write_text("tool\n")
+
+        copy_directory_contents(source, tmp_path / "." / "source")
+
+        assert (source / "pkg" / "mod.py").read_text() == "mod\n"
+        assert (source / "tool.py").read_text() == "tool\n"
+
+
+class TestCopyScriptFile:
+    """Tests for copy_script_file function."""
+
+    def test_copy_onto_itself_returns_existing_script(self, tmp_path: Path) -> None:
+        """A script whose destination is its own source should be returned without copying."""
+        (tmp_path / "tool.py").write_text("tool\n")
+
+        assert copy_script_file(tmp_path, "tool.py", tmp_path) == tmp_path / "tool.py"
+        assert (tmp_path / "tool.py").read_text() == "tool\n"